@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import io
 import os
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
+# Imported once here so the first describe call doesn't pay for it. A missing
+# package is reported when an LlmAgent is created, so the UI still starts.
+try:
+    from PIL import Image, ImageOps  # pillow
+    from google import genai  # google-genai
+    from google.genai import types
+except ImportError as _e:
+    Image = ImageOps = genai = types = None
+    _IMPORT_ERROR: Optional[ImportError] = _e
+else:
+    _IMPORT_ERROR = None
+
+from .llm_cache import DEFAULT_CACHE_PATH, ResponseCache, make_cache_key
+
+# (left, top, right, bottom) in source pixels, as used by PIL.Image.crop
+CropBox = Tuple[int, int, int, int]
+
 
 @dataclass(frozen=True)
 class LlmAgentConfig:
@@ -15,6 +35,12 @@ class LlmAgentConfig:
         "Focus on what is visually present and any important textures/patterns. "
         "Avoid guessing details that are not visible."
     )
+    # Response cache: in-memory LRU size, and SQLite file (None = memory only).
+    cache_size: int = 256
+    cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+    # Uploads are shrunk to this long edge and sent as JPEG (0 = send the image as-is).
+    upload_max_side: int = 768
+    upload_jpeg_quality: int = 80
 
 
 class LlmAgent:
@@ -24,6 +50,9 @@ class LlmAgent:
       - loads GOOGLE_API_KEY from .env
       - sends [prompt, image] to the model
       - returns response.text (string)
+
+    Responses are cached by (model, prompt, image bytes), so describing the same
+    crop twice only hits the network once.
     """
 
     def __init__(self, config: Optional[LlmAgentConfig] = None):
@@ -34,27 +63,152 @@ class LlmAgent:
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment variables (.env).")
 
-        try:
-            from google import genai  # google-genai
-        except Exception as e:
+        if _IMPORT_ERROR is not None:
             raise ImportError(
-                "Missing dependency for Gemini image calls. Install: pip install google-genai"
-            ) from e
+                "Missing dependency for Gemini image calls. Install: pip install google-genai pillow"
+            ) from _IMPORT_ERROR
 
         self._client = genai.Client(api_key=api_key)
+        self._cache = ResponseCache(self.config.cache_size, self.config.cache_path)
 
-    def describe_image(self, image_path: str, prompt: Optional[str] = None) -> str:
-        """Describe an image at `image_path`. Returns plain text."""
-        from PIL import Image  # pillow
+        # Last decoded crop source: (path, mtime_ns, size) -> (bytes, PIL image).
+        # Repeated crops of the same image reuse one decode.
+        self._source_lock = threading.Lock()
+        self._source_key: Optional[Tuple[str, int, int]] = None
+        self._source: Optional[Tuple[bytes, object]] = None
 
+    def _resolve_prompt(self, prompt: Optional[str]) -> str:
         p = (prompt or self.config.default_prompt).strip()
-        if not p:
-            p = self.config.default_prompt
+        return p or self.config.default_prompt
+
+    @staticmethod
+    def _read_bytes(image_path: str) -> bytes:
+        with open(image_path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _open_image(data: bytes, draft_side: int = 0):
+        img = Image.open(io.BytesIO(data))
+        if draft_side > 0:
+            # JPEG only: let libjpeg decode at a reduced scale (no-op for other formats)
+            img.draft("RGB", (draft_side, draft_side))
+        img.load()
+        return img
+
+    def _to_upload(self, img):
+        """Downsize `img` to `upload_max_side` and re-encode it as a JPEG part.
+
+        Gemini downsamples large images anyway, so this mostly saves upload time.
+        """
+        side = int(self.config.upload_max_side)
+        if side <= 0:
+            return img
+
+        if img.width > side or img.height > side:
+            img.thumbnail((side, side), Image.Resampling.LANCZOS)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=int(self.config.upload_jpeg_quality), optimize=True)
+        return types.Part.from_bytes(data=buf.getvalue(), mime_type="image/jpeg")
+
+    def _load_source(self, image_path: str) -> Tuple[bytes, object]:
+        """Bytes + decoded image for a crop source, memoized while the file is unchanged."""
+        st = os.stat(image_path)
+        key = (os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+        with self._source_lock:
+            if key == self._source_key and self._source is not None:
+                return self._source
+            data = self._read_bytes(image_path)
+            # Upright like the Qt view (auto-transform), so crop boxes line up with it
+            self._source = (data, ImageOps.exif_transpose(self._open_image(data)))
+            self._source_key = key
+            return self._source
 
-        img = Image.open(image_path)
+    def _prepare(self, image_path: str, crop_box: Optional[CropBox]):
+        """Return (source bytes, thunk producing the image to upload).
+
+        The decode is deferred so cache hits never pay for it; crops come from the
+        memoized source frame.
+        """
+        if crop_box is None:
+            data = self._read_bytes(image_path)
+            side = max(0, int(self.config.upload_max_side))
+            return data, lambda: self._to_upload(ImageOps.exif_transpose(self._open_image(data, side)))
+        data, src = self._load_source(image_path)
+        return data, lambda: self._to_upload(src.crop(crop_box))
+
+    def _cache_key(self, prompt: str, data: bytes, crop_box: Optional[CropBox] = None) -> str:
+        box_key = "" if crop_box is None else ",".join(str(int(v)) for v in crop_box)
+        return make_cache_key(self.config.model_name, prompt, data, box_key)
+
+    def warm_up(self) -> None:
+        """Send a 1-token request so the HTTPS connection is open before the first describe."""
+        try:
+            self._client.models.generate_content(
+                model=self.config.model_name,
+                contents="ping",
+                config=types.GenerateContentConfig(max_output_tokens=1),
+            )
+        except Exception as e:
+            print(f"[LLM] Warm-up failed (reason: {e})")
+
+    def describe_image(
+        self,
+        image_path: str,
+        prompt: Optional[str] = None,
+        *,
+        crop_box: Optional[CropBox] = None,
+    ) -> str:
+        """Describe an image at `image_path` (optionally only `crop_box`). Returns plain text."""
+        p = self._resolve_prompt(prompt)
+        data, make_image = self._prepare(image_path, crop_box)
+
+        key = self._cache_key(p, data, crop_box)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
         resp = self._client.models.generate_content(
             model=self.config.model_name,
-            contents=[p, img],
+            contents=[p, make_image()],
         )
-        return (resp.text or "").strip()
+        text = (resp.text or "").strip()
+        if text:
+            self._cache.set(key, text)
+        return text
+
+    def describe_image_stream(
+        self,
+        image_path: str,
+        prompt: Optional[str] = None,
+        *,
+        crop_box: Optional[CropBox] = None,
+    ) -> Iterator[str]:
+        """Like `describe_image`, but yields text chunks as the model produces them.
+
+        A cache hit yields the whole cached text as a single chunk.
+        """
+        p = self._resolve_prompt(prompt)
+        data, make_image = self._prepare(image_path, crop_box)
+
+        key = self._cache_key(p, data, crop_box)
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: List[str] = []
+        for chunk in self._client.models.generate_content_stream(
+            model=self.config.model_name,
+            contents=[p, make_image()],
+        ):
+            piece = chunk.text or ""
+            if piece:
+                parts.append(piece)
+                yield piece
+
+        text = "".join(parts).strip()
+        if text:
+            self._cache.set(key, text)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "bisonhacks" / "llm_cache.sqlite"
+
+
+def make_cache_key(model_name: str, prompt: str, image_bytes: bytes, *extra: str) -> str:
+    """Stable key for a (model, prompt, image[, extra...]) request."""
+    h = hashlib.sha256()
+    h.update(model_name.encode("utf-8"))
+    h.update(b"\0")
+    h.update(prompt.encode("utf-8"))
+    h.update(b"\0")
+    h.update(hashlib.sha256(image_bytes).digest())
+    for part in extra:
+        h.update(b"\0")
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResponseCache:
+    """Two-tier cache for model responses.
+
+    - in-memory LRU (OrderedDict) bounded to `max_entries`
+    - optional SQLite file so results survive restarts
+
+    Safe to use from worker threads.
+    """
+
+    def __init__(self, max_entries: int = 256, db_path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self._max_entries = max(1, int(max_entries))
+        self._mem: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if db_path is not None:
+            try:
+                db_path = Path(db_path)
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"[LLM] Disk cache disabled (reason: {e})")
+                self._db = None
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._mem.get(key)
+            if text is not None:
+                self._mem.move_to_end(key)
+                return text
+
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute("SELECT text FROM responses WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+
+            self._remember_locked(key, row[0])
+            return row[0]
+
+    def set(self, key: str, text: str) -> None:
+        with self._lock:
+            self._remember_locked(key, text)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, text) VALUES (?, ?)", (key, text)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"[LLM] Failed to persist cache entry: {e}")
+
+    def _remember_locked(self, key: str, text: str) -> None:
+        self._mem[key] = text
+        self._mem.move_to_end(key)
+        while len(self._mem) > self._max_entries:
+            self._mem.popitem(last=False)
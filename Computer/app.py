@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import argparse
 import sys
+from typing import List, Optional
 
 from PySide6.QtWidgets import QApplication
 
@@ -10,39 +12,73 @@ from models.config import GridConfig, UiConfig
 from models.state import AppState
 
 
-def main() -> int:
-    # CHANGE THIS:
-    IMAGE_PATH = r"images/image3.jpg"
+# Defaults (override with --config / command-line flags)
+DEFAULT_IMAGE_PATH = r"images/image3.jpg"
+DEFAULT_CHOICES = ["Humidity Intensity Gradient", "Color Saturation Variation", "Contour Line Density"]
 
-    state = AppState(
-        image_path=IMAGE_PATH,
-        choices=["Humidity Intensity Gradient", "Color Saturation Variation", "Contour Line Density"],
-        grid=GridConfig(rows=12, cols=12),
+# Parsed by Qt once per process
+STYLE = """
+    QListWidget {
+        font-size: 18px;
+        padding: 8px;
+        background: #111;
+        color: white;
+        border: 1px solid #333;
+        border-radius: 10px;
+    }
+    QListWidget::item { padding: 10px; border-radius: 8px; }
+    QListWidget[mode="choosing"]::item:selected {
+        background: #2a4;
+        color: black;
+        border: 2px solid #7f7;
+    }
+    QListWidget[mode="running"]::item:selected {
+        background: #333;
+        color: white;
+        border: 1px solid #666;
+    }
+"""
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="VisionMouse desktop UI")
+    parser.add_argument("--config", help="TOML file with image / choices / rows / cols")
+    parser.add_argument("--image", help="Image to display")
+    parser.add_argument("--choices", nargs="+", help="Choice labels")
+    parser.add_argument("--rows", type=int, help="Grid rows")
+    parser.add_argument("--cols", type=int, help="Grid cols")
+    return parser.parse_args(argv)
+
+
+def load_state(args: argparse.Namespace) -> AppState:
+    """Build AppState from defaults, then the TOML file, then command-line flags."""
+    cfg = {}
+    if args.config:
+        try:
+            import tomllib  # Python 3.11+
+        except ModuleNotFoundError:
+            import tomli as tomllib  # same API, for older Pythons
+        with open(args.config, "rb") as f:
+            cfg = tomllib.load(f)
+
+    defaults = GridConfig()
+    rows = args.rows if args.rows is not None else cfg.get("rows", defaults.rows)
+    cols = args.cols if args.cols is not None else cfg.get("cols", defaults.cols)
+
+    return AppState(
+        image_path=args.image or cfg.get("image", DEFAULT_IMAGE_PATH),
+        choices=list(args.choices or cfg.get("choices", DEFAULT_CHOICES)),
+        grid=GridConfig(rows=int(rows), cols=int(cols)),
     )
 
-    app = QApplication(sys.argv)
-
-    app.setStyleSheet("""
-        QListWidget { 
-            font-size: 18px; 
-            padding: 8px; 
-            background: #111; 
-            color: white;
-            border: 1px solid #333;
-            border-radius: 10px;
-        }
-        QListWidget::item { padding: 10px; border-radius: 8px; }
-        QListWidget[mode="choosing"]::item:selected { 
-            background: #2a4; 
-            color: black;
-            border: 2px solid #7f7;
-        }
-        QListWidget[mode="running"]::item:selected { 
-            background: #333; 
-            color: white; 
-            border: 1px solid #666;
-        }
-    """)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    state = load_state(parse_args(argv))
+
+    app = QApplication(sys.argv[:1] + argv)
+    app.setStyleSheet(STYLE)
 
     controller = AppController(state)
     window = MainWindow(controller, ui=UiConfig(window_title="VisionMouse"))
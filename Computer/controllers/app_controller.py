@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+import itertools
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot, QPointF
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QObject, QSize, QThreadPool, QTimer, Signal, Slot, QPointF
+from PySide6.QtGui import QImage, QPixmap
 
+from agents.llm_agent import CropBox, LlmAgent, LlmAgentConfig
+from controllers.image_loader import ImageLoader
+from controllers.llm_runnable import LlmDescribeRunnable
 from models.state import AppState
 
 
+def _clamp_index(i: int, n: int) -> int:
+    """Clamp `i` into [0, n-1] (n >= 1) with one conditional expression."""
+    return 0 if i < 0 else (n - 1 if i >= n else i)
+
+
 class AppController(QObject):
     """Application controller (signals-only; no UI code).
 
@@ -18,6 +29,8 @@ class AppController(QObject):
 
     # Image + overlays
     image_changed = Signal(QPixmap)
+    detail_image_changed = Signal(QPixmap)       # same image at full resolution (on zoom-in)
+    image_load_failed = Signal(str)              # error message (decode failed)
     point_changed = Signal(QPointF)              # a dynamic point in image coords
     grid_config_changed = Signal(int, int)       # rows, cols
 
@@ -27,6 +40,16 @@ class AppController(QObject):
     chosen_choice_changed = Signal(int, str)     # chosen index + text
     choose_mode_changed = Signal(bool)           # True: choosing, False: running
 
+    # LLM region descriptions (only the latest request is delivered)
+    description_partial = Signal(str)            # text received so far (streaming)
+    description_ready = Signal(str)
+    description_failed = Signal(str)
+
+    # Max concurrent Gemini calls; extra requests wait in the pool queue.
+    LLM_MAX_THREADS = 2
+    # Streamed pieces are coalesced and re-emitted at most this often.
+    LLM_PARTIAL_FLUSH_MS = 50
+
     def __init__(self, state: AppState):
         super().__init__()
         self.state = state
@@ -37,24 +60,63 @@ class AppController(QObject):
         self._choosing: bool = False
         self._highlighted_index: int = 0
         self._chosen_index: Optional[int] = None
+        # len(state.choices), kept in sync by update_choices (hot on arrow keys)
+        self._n_choices: int = len(state.choices)
+
+        # Reused by update_point_xy (remote mouse packets)
+        self._point_buf = QPointF()
+
+        # Last decode job; held so the runnable + its signals object outlive the worker.
+        self._image_loader: Optional[ImageLoader] = None
+        # Full-resolution decode, started once the view zooms past the decoded size
+        self._detail_loader: Optional[ImageLoader] = None
+        # Decoded pixels per source pixel (< 1 when decoded at viewport size)
+        self._image_scale: float = 1.0
+
+        # LLM dispatch: bounded pool + request ids so stale answers are dropped.
+        self._llm_agent: Optional[LlmAgent] = None
+        self._llm_agent_lock = threading.Lock()  # built by whichever pool worker needs it first
+        self._llm_unavailable = False  # set once building the agent has failed
+        self._llm_pool = QThreadPool(self)
+        self._llm_pool.setMaxThreadCount(self.LLM_MAX_THREADS)
+        self._llm_jobs: Dict[int, LlmDescribeRunnable] = {}  # in flight or queued
+        # Monotonic ids (next() on itertools.count is atomic under the GIL);
+        # only answers tagged with the latest id are delivered.
+        self._llm_ids = itertools.count(1)
+        self._llm_request_id: int = 0
+        self._llm_partial: List[str] = []
+        self._llm_partial_dirty = False
+        self._llm_flush_timer = QTimer(self)
+        self._llm_flush_timer.setInterval(self.LLM_PARTIAL_FLUSH_MS)
+        self._llm_flush_timer.timeout.connect(self._flush_partial_description)
 
     # -----------------------------
     # Boot
     # -----------------------------
-    def load_initial_image(self) -> None:
+    def load_initial_image(self, target_size: Optional[QSize] = None) -> None:
+        """Start decoding the image off the GUI thread and publish the initial choices.
+
+        `target_size` (device pixels) lets the decoder shrink large images to the
+        viewport instead of decoding full resolution (zooming in loads it later, see
+        `load_full_resolution`; LLM crops always read the file). The image itself
+        (plus grid + initial point) is emitted from `_on_image_decoded` once the
+        worker finishes; decode errors arrive via `image_load_failed`.
+        """
         path = self.state.image_file()
         if not path.exists():
             raise FileNotFoundError(f"Image not found: {path}")
 
-        pix = QPixmap(str(path))
-        if pix.isNull():
-            raise ValueError(f"Failed to load image: {path}")
-
-        self.image_changed.emit(pix)
-        self.grid_config_changed.emit(self.state.grid.rows, self.state.grid.cols)
+        self._detail_loader = None
+        loader = ImageLoader(str(path), target_size)
+        loader.setAutoDelete(False)
+        loader.signals.finished.connect(self._on_image_decoded)
+        loader.signals.failed.connect(self.image_load_failed)
+        self._image_loader = loader
+        QThreadPool.globalInstance().start(loader)
 
-        # initial point (top-left-ish)
-        self.point_changed.emit(QPointF(50, 50))
+        # Build the Gemini client and open its connection while the user looks around.
+        if os.getenv("GEMINI_WARMUP", "1") != "0":
+            self._llm_pool.start(self._warm_up_llm)
 
         # initial choices
         self.choices_updated.emit(list(self.state.choices))
@@ -64,6 +126,42 @@ class AppController(QObject):
 
         self.choose_mode_changed.emit(self._choosing)
 
+    @Slot(QImage, QSize)
+    def _on_image_decoded(self, img: QImage, source_size: QSize) -> None:
+        self._image_scale = img.width() / source_size.width() if source_size.width() > 0 else 1.0
+
+        self.image_changed.emit(QPixmap.fromImage(img))  # GUI thread only
+        self.grid_config_changed.emit(self.state.grid.rows, self.state.grid.cols)
+
+        # initial point (top-left-ish, 50 source pixels in)
+        s = self._image_scale
+        self.point_changed.emit(QPointF(50 * s, 50 * s))
+
+    def image_scale(self) -> float:
+        """Decoded (image coordinate) pixels per source pixel."""
+        return self._image_scale
+
+    @Slot()
+    def load_full_resolution(self) -> None:
+        """Decode the image at full size once; emitted via `detail_image_changed`.
+
+        No-op if the displayed image already is full size or the decode was started.
+        """
+        if self._image_scale >= 1.0 or self._detail_loader is not None:
+            return
+        loader = ImageLoader(str(self.state.image_file()))
+        loader.setAutoDelete(False)
+        loader.signals.finished.connect(self._on_detail_decoded)
+        self._detail_loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    @Slot(QImage, QSize)
+    def _on_detail_decoded(self, img: QImage, _source_size: QSize) -> None:
+        loader = self._detail_loader
+        if loader is None or self.sender() is not loader.signals:
+            return  # a newer image was loaded meanwhile
+        self.detail_image_changed.emit(QPixmap.fromImage(img))
+
     # -----------------------------
     # Choice UX state machine
     # -----------------------------
@@ -76,16 +174,16 @@ class AppController(QObject):
         self._choosing = True
         self.choose_mode_changed.emit(True)
         # Ensure highlight is valid
-        if self.state.choices:
-            self._highlighted_index = min(max(self._highlighted_index, 0), len(self.state.choices) - 1)
+        if self._n_choices:
+            self._highlighted_index = _clamp_index(self._highlighted_index, self._n_choices)
             self.highlighted_choice_changed.emit(self._highlighted_index)
 
     def confirm_choice(self) -> None:
         if not self._choosing:
             return
-        if not self.state.choices:
+        if not self._n_choices:
             return
-        idx = min(max(self._highlighted_index, 0), len(self.state.choices) - 1)
+        idx = _clamp_index(self._highlighted_index, self._n_choices)
         self._chosen_index = idx
         text = self.state.choices[idx]
 
@@ -97,17 +195,17 @@ class AppController(QObject):
     def move_highlight(self, delta: int) -> None:
         if not self._choosing:
             return
-        if not self.state.choices:
+        if not self._n_choices:
             return
-        n = len(self.state.choices)
-        self._highlighted_index = (self._highlighted_index + int(delta)) % n
+        self.cancel_pending_descriptions()
+        self._highlighted_index = (self._highlighted_index + int(delta)) % self._n_choices
         self.highlighted_choice_changed.emit(self._highlighted_index)
 
     # For later: when highlight is driven by external input (websocket)
     def update_highlighted_choice(self, index: int) -> None:
-        if not self.state.choices:
+        if not self._n_choices:
             return
-        idx = min(max(int(index), 0), len(self.state.choices) - 1)
+        idx = _clamp_index(int(index), self._n_choices)
         self._highlighted_index = idx
         self.highlighted_choice_changed.emit(idx)
 
@@ -115,12 +213,13 @@ class AppController(QObject):
     def update_choices(self, choices: Iterable[str]) -> None:
         new_choices: List[str] = list(choices)
         self.state.choices = new_choices
+        self._n_choices = len(new_choices)
 
         # Keep highlight/chosen indices in range
         if new_choices:
-            self._highlighted_index = min(max(self._highlighted_index, 0), len(new_choices) - 1)
+            self._highlighted_index = _clamp_index(self._highlighted_index, len(new_choices))
             if self._chosen_index is not None:
-                self._chosen_index = min(max(self._chosen_index, 0), len(new_choices) - 1)
+                self._chosen_index = _clamp_index(self._chosen_index, len(new_choices))
         else:
             self._highlighted_index = -1
             self._chosen_index = None
@@ -137,6 +236,7 @@ class AppController(QObject):
     # Click selection from UI should behave like "confirm choice"
     @Slot(int, str)
     def on_choice_clicked(self, index: int, text: str) -> None:
+        self.cancel_pending_descriptions()
         if self.state.choices:
             self.update_highlighted_choice(index)
         if self._choosing:
@@ -152,8 +252,135 @@ class AppController(QObject):
         """External systems should call this to move the point (image coords)."""
         self.point_changed.emit(pos)
 
+    def update_point_xy(self, x: float, y: float) -> None:
+        """Like update_point, for high-rate float sources (reuses one QPointF).
+
+        Receivers must not keep the emitted point (ImageCanvas copies it).
+        """
+        p = self._point_buf
+        p.setX(x)
+        p.setY(y)
+        self.point_changed.emit(p)
+
     def set_grid(self, rows: int, cols: int) -> None:
         rows = max(1, int(rows))
         cols = max(1, int(cols))
         self.state.grid = self.state.grid.__class__(rows=rows, cols=cols, line_width=self.state.grid.line_width)
         self.grid_config_changed.emit(rows, cols)
+
+    # -----------------------------
+    # LLM region descriptions
+    # -----------------------------
+    def _get_llm_agent(self) -> Optional[LlmAgent]:
+        if self._llm_agent is not None:
+            return self._llm_agent
+        with self._llm_agent_lock:
+            if self._llm_agent is None and not self._llm_unavailable:
+                self._llm_agent = self._create_llm_agent()
+                self._llm_unavailable = self._llm_agent is None
+        return self._llm_agent
+
+    @staticmethod
+    def _create_llm_agent() -> Optional[LlmAgent]:
+        try:
+            # You can override model/prompt via env if desired
+            model_name = os.getenv("GEMINI_MODEL_NAME", "gemini-2.5-flash")
+            prompt = os.getenv(
+                "GEMINI_CROP_PROMPT",
+                "Describe this cropped image region in 2 to 4 short sentences. "
+                "Focus on what is visually present and any important textures/patterns.",
+            )
+            return LlmAgent(LlmAgentConfig(model_name=model_name, default_prompt=prompt))
+        except Exception as e:
+            print(f"[LLM] Disabled (reason: {e})")
+            return None
+
+    def _warm_up_llm(self) -> None:
+        # Runs on an LLM pool worker; touches no Qt objects.
+        agent = self._get_llm_agent()
+        if agent is not None:
+            agent.warm_up()
+
+    def describe_region(self, image_path: str, crop_box: Optional[CropBox] = None) -> bool:
+        """Queue a description of `image_path` (optionally `crop_box`) on the LLM pool.
+
+        A new request supersedes older ones: queued jobs are dropped and answers from
+        jobs already running are ignored. The agent is built on the worker, so this never
+        waits on it. Returns False once the LLM is known to be unavailable.
+        """
+        if self._llm_unavailable:
+            return False
+
+        self.cancel_pending_descriptions()
+
+        self._llm_request_id = next(self._llm_ids)
+        self._llm_partial.clear()
+        self._llm_partial_dirty = False
+        job = LlmDescribeRunnable(self._get_llm_agent, self._llm_request_id, image_path, crop_box)
+        job.setAutoDelete(False)
+        job.signals.chunk.connect(self._on_description_chunk)
+        job.signals.finished.connect(self._on_description_finished)
+        job.signals.failed.connect(self._on_description_failed)
+        self._llm_jobs[job.request_id] = job
+        self._llm_pool.start(job)
+        return True
+
+    def describe_around_point(self, pos: QPointF, size: int = 256) -> bool:
+        """Describe the `size` x `size` square (source pixels) around `pos` (image coords).
+
+        The crop is cut from the source file at full resolution, so it covers the same
+        part of the image whatever the window size.
+        """
+        s = self._image_scale
+        half = size / 2
+        cx, cy = pos.x() / s, pos.y() / s
+        box = (int(round(cx - half)), int(round(cy - half)), int(round(cx + half)), int(round(cy + half)))
+        return self.describe_region(str(self.state.image_file()), box)
+
+    def cancel_pending_descriptions(self) -> None:
+        """Drop queued describe jobs and mark running ones stale."""
+        if not self._llm_jobs:
+            return
+        for rid, job in list(self._llm_jobs.items()):
+            if self._llm_pool.tryTake(job):
+                del self._llm_jobs[rid]
+        self._llm_request_id = next(self._llm_ids)
+        self._llm_flush_timer.stop()
+
+    def shutdown(self) -> None:
+        """Stop dispatching LLM work on exit: drop queued jobs, ignore running ones."""
+        self.cancel_pending_descriptions()
+        self._llm_pool.clear()
+        self._llm_request_id = next(self._llm_ids)
+
+    @Slot(int, str)
+    def _on_description_chunk(self, request_id: int, piece: str) -> None:
+        if request_id != self._llm_request_id:
+            return
+        self._llm_partial.append(piece)
+        self._llm_partial_dirty = True
+        if not self._llm_flush_timer.isActive():
+            self._llm_flush_timer.start()
+
+    def _flush_partial_description(self) -> None:
+        if not self._llm_partial_dirty:
+            self._llm_flush_timer.stop()
+            return
+        self._llm_partial_dirty = False
+        self.description_partial.emit("".join(self._llm_partial))
+
+    @Slot(int, str)
+    def _on_description_finished(self, request_id: int, text: str) -> None:
+        self._llm_jobs.pop(request_id, None)
+        if request_id == self._llm_request_id:
+            self._llm_flush_timer.stop()
+            self._llm_partial.clear()
+            self._llm_partial_dirty = False
+            self.description_ready.emit(text)
+
+    @Slot(int, str)
+    def _on_description_failed(self, request_id: int, message: str) -> None:
+        self._llm_jobs.pop(request_id, None)
+        if request_id == self._llm_request_id:
+            self._llm_flush_timer.stop()
+            self.description_failed.emit(message)
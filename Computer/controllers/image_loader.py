@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QObject, QRunnable, QSize, Qt, Signal
+from PySide6.QtGui import QImage, QImageIOHandler, QImageReader
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "bisonhacks" / "images"
+
+
+class ImageLoadSignals(QObject):
+    finished = Signal(QImage, QSize)  # decoded image, full source size (as displayed)
+    failed = Signal(str)
+
+
+class ImageLoader(QRunnable):
+    """Decode an image file into a QImage on a QThreadPool worker.
+
+    QPixmap must only be created on the GUI thread, QImage has no such restriction,
+    so the decode happens here and the receiver converts to QPixmap on the main thread.
+
+    If `target_size` is given and the source is larger, the reader decodes straight
+    to that size (aspect kept). For JPEG this uses the decoder's DCT scaling, so the
+    full-resolution frame is never materialized.
+
+    Independently of `target_size`, the long edge is capped at `max_dim` so an
+    oversized file can't blow up memory (or trip Qt's allocation limit).
+
+    Scaled results are kept as PNG under `cache_dir`, keyed by source path, mtime
+    and output size, so the next launch at the same window size skips the rescale.
+    Storing one drops entries for older versions of the file and all but the
+    `MAX_CACHED_SIZES` most recent sizes of the current one.
+
+    `finished` also carries the source size, so receivers can map decoded pixels
+    back to the file (crops for the LLM, a later full-resolution decode).
+    """
+
+    MAX_CACHED_SIZES = 3
+
+    def __init__(
+        self,
+        path: str,
+        target_size: Optional[QSize] = None,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        max_dim: int = 4096,
+    ):
+        super().__init__()
+        self.path = path
+        self.target_size = target_size
+        self.cache_dir = cache_dir
+        self.max_dim = max_dim
+        # Created on the caller's (GUI) thread, so connected slots run there too.
+        self.signals = ImageLoadSignals()
+
+    def run(self) -> None:
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+
+        source_size = self._oriented_size(reader)
+        scaled = self._scaled_size(reader.size())
+        cache_path = self._cache_path(scaled) if scaled is not None else None
+
+        if cache_path is not None and cache_path.exists():
+            img = QImage(str(cache_path))
+            if not img.isNull():
+                self.signals.finished.emit(img, source_size)
+                return
+
+        if scaled is not None:
+            reader.setScaledSize(scaled)
+
+        img = reader.read()
+        if img.isNull():
+            self.signals.failed.emit(f"Failed to load image: {self.path} ({reader.errorString()})")
+            return
+
+        if cache_path is not None:
+            self._store(img, cache_path)
+        self.signals.finished.emit(img, source_size)
+
+    @staticmethod
+    def _oriented_size(reader: QImageReader) -> QSize:
+        # reader.size() is before the EXIF rotation that setAutoTransform applies
+        size = reader.size()
+        if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+            size = size.transposed()
+        return size
+
+    def _cache_path(self, size: QSize) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        try:
+            src = Path(self.path).resolve()
+            mtime_ns = src.stat().st_mtime_ns
+        except OSError:
+            return None
+        digest = hashlib.sha1(str(src).encode("utf-8")).hexdigest()[:16]
+        return Path(self.cache_dir) / f"{digest}_{mtime_ns}_{size.width()}x{size.height()}.png"
+
+    def _store(self, img: QImage, cache_path: Path) -> None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp.png")
+            if img.save(str(tmp_path), "PNG"):
+                os.replace(tmp_path, cache_path)
+                self._prune(cache_path)
+        except OSError as e:
+            print(f"[Image] Failed to cache scaled image: {e}")
+
+    def _prune(self, cache_path: Path) -> None:
+        # Names are <digest>_<mtime_ns>_<w>x<h>.png; only this source's entries are touched
+        digest, mtime, _ = cache_path.stem.split("_", 2)
+        kept = []
+        for entry in cache_path.parent.glob(f"{digest}_*.png"):
+            if entry == cache_path or entry.name.endswith(".tmp.png"):
+                continue
+            try:
+                if entry.stem.split("_", 2)[1] != mtime:
+                    entry.unlink()  # older version of the file
+                else:
+                    kept.append((entry.stat().st_mtime, entry))
+            except (OSError, IndexError):
+                continue
+        kept.sort(reverse=True)
+        for _, entry in kept[self.MAX_CACHED_SIZES - 1 :]:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+    def _scaled_size(self, src: QSize) -> Optional[QSize]:
+        if not src.isValid():
+            return None
+        bound = QSize(self.max_dim, self.max_dim)
+        target = self.target_size
+        if target is not None and target.isValid() and not target.isEmpty():
+            bound = bound.boundedTo(target)
+        if src.width() <= bound.width() and src.height() <= bound.height():
+            return None
+        return src.scaled(bound, Qt.AspectRatioMode.KeepAspectRatio)
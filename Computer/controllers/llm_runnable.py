@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from agents.llm_agent import CropBox, LlmAgent
+
+
+class LlmDescribeSignals(QObject):
+    chunk = Signal(int, str)     # request id, streamed text piece
+    finished = Signal(int, str)  # request id, full description
+    failed = Signal(int, str)    # request id, error message
+
+
+class LlmDescribeRunnable(QRunnable):
+    """Run one streamed `LlmAgent` description on a QThreadPool worker.
+
+    Text pieces are emitted as they arrive, then the full text once done. Everything
+    is tagged with `request_id` so the receiver can drop stale answers.
+
+    The agent comes from `get_agent`, called on the worker, so a first request that
+    has to build the client never blocks the caller.
+    """
+
+    def __init__(
+        self,
+        get_agent: Callable[[], Optional[LlmAgent]],
+        request_id: int,
+        image_path: str,
+        crop_box: Optional[CropBox] = None,
+    ):
+        super().__init__()
+        self.get_agent = get_agent
+        self.request_id = request_id
+        self.image_path = image_path
+        self.crop_box = crop_box
+        # Created on the caller's (GUI) thread, so connected slots run there too.
+        self.signals = LlmDescribeSignals()
+
+    def run(self) -> None:
+        parts = []
+        try:
+            agent = self.get_agent()
+            if agent is None:
+                self.signals.failed.emit(self.request_id, "LLM is unavailable.")
+                return
+            for piece in agent.describe_image_stream(self.image_path, crop_box=self.crop_box):
+                parts.append(piece)
+                self.signals.chunk.emit(self.request_id, piece)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.request_id, "".join(parts).strip())
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import itertools
 import os
+import queue
 import threading
 import tempfile
+import time
+import wave
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Slot, Qt, QObject, Signal, QPointF
+from PySide6.QtCore import Slot, Qt, QObject, Signal, QPointF, QRectF, QSize, QTimer
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QMainWindow, QMessageBox, QSplitter
 
+try:
+    import pygame
+    _HAS_PYGAME = True
+except ImportError:
+    pygame = None
+    _HAS_PYGAME = False
+
 from controllers.app_controller import AppController
 from ui.choices_panel import ChoicesPanel
 from ui.image_canvas import ImageCanvas
@@ -20,6 +34,9 @@ load_dotenv()
 
 from network.ws_server import WebSocketPositionServer, WebSocketServerConfig
 
+# TTS queue item asking the worker to close the mixer (None asks it to exit)
+_TTS_RELEASE_AUDIO = (0, "")
+
 
 class _WsBridge(QObject):
     mouse_pos = Signal(float, float, float, float)  # x,y,w,h
@@ -27,6 +44,12 @@ class _WsBridge(QObject):
 
 
 class MainWindow(QMainWindow):
+    HIGHLIGHT_DEBOUNCE_MS = 150
+    # Synthesized speech: hottest decoded in memory, all of them (as received) on disk
+    TTS_MEM_CACHE_SIZE = 32
+    # Streamed PCM is played in blocks of this length as it downloads
+    TTS_STREAM_BLOCK_S = 0.2
+
     def __init__(self, controller: AppController, ui: UiConfig = UiConfig()):
         super().__init__()
         self.controller = controller
@@ -34,22 +57,59 @@ class MainWindow(QMainWindow):
         # Used to suppress first highlight speech when entering choosing mode
         self._suppress_next_highlight_tts = False
 
+        # Highlight speech is debounced: only the index the user settles on is spoken.
+        self._pending_highlight_text = ""
+        self._hl_timer = QTimer(self)
+        self._hl_timer.setSingleShot(True)
+        self._hl_timer.setInterval(self.HIGHLIGHT_DEBOUNCE_MS)
+        self._hl_timer.timeout.connect(self._fire_highlight)
+
+        # Mode announcements are deferred to the end of the current event so a
+        # confirmation spoken right after ("Chosen. X") replaces them instead of
+        # cancelling an already-started synthesis.
+        self._pending_mode_text = ""
+        self._mode_tts_timer = QTimer(self)
+        self._mode_tts_timer.setSingleShot(True)
+        self._mode_tts_timer.setInterval(0)
+        self._mode_tts_timer.timeout.connect(self._fire_mode_announcement)
+
         # --- TTS state ---
         self._tts_enabled = True
-        self._tts_lock = threading.Lock()
-        self._tts_generation = 0  # increment to cancel/override older speech
+        # Speech generations: next() on itertools.count and int rebinding are atomic under
+        # the GIL, so cancel checks need no lock. Bump to cancel/override older speech.
+        self._tts_gen_counter = itertools.count(1)
+        self._tts_generation = 0  # latest generation
         self._eleven_client = None  # lazy init
+        self._eleven_client_lock = threading.Lock()
+        self._tts_warmup_started = False
+        # One worker thread serves every speak(); the queue holds at most the newest request
+        self._tts_queue: "queue.Queue[Optional[tuple[int, str]]]" = queue.Queue(maxsize=1)
+        self._tts_thread = threading.Thread(target=self._tts_loop, name="tts", daemon=True)
+        self._tts_thread.start()
         self._pygame_ready = False
+        self._pcm_verbatim = False  # mixer runs exactly mono/s16 at the PCM rate
+        self._tts_channel = None  # reserved mixer channel for speech
+        # Bound methods of the channel/mixer, set once the mixer is up (hot on every cancel/play)
+        self._channel_stop = None
+        self._channel_play = None
+        self._make_sound = None
         self._last_choosing_state: Optional[bool] = None  # avoid double MODE speech
 
 
-        # --- LLM (Gemini) image-region describer ---
-        self._llm_agent = None  # lazy init
-
         # Optional: configure voice/model via env
         self._eleven_voice_id = os.getenv("ELEVENLABS_VOICE_ID", "xctasy8XvGp2cVO9HL9k")
-        self._eleven_model_id = os.getenv("ELEVENLABS_MODEL_ID", "eleven_multilingual_v2")
-        self._eleven_output_format = os.getenv("ELEVENLABS_OUTPUT_FORMAT", "mp3_44100_128")
+        # Flash v2.5: lowest time-to-first-byte, still multilingual
+        self._eleven_model_id = os.getenv("ELEVENLABS_MODEL_ID", "eleven_flash_v2_5")
+        # Raw 16-bit mono PCM at 22.05 kHz: pygame plays it as-is, no MP3 decode.
+        # "mp3_*" formats still work (smaller download, decoded once per phrase).
+        self._eleven_output_format = os.getenv("ELEVENLABS_OUTPUT_FORMAT", "pcm_22050")
+        self._tts_is_pcm = self._eleven_output_format.startswith("pcm_")
+        self._tts_cache_ext = "pcm" if self._tts_is_pcm else "mp3"
+
+        # Recurring phrases (mode names, menu labels) are synthesized once
+        self._tts_cache_dir = Path(tempfile.gettempdir()) / "bison_tts"
+        self._tts_mem_cache: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
+        self._tts_cache_lock = threading.Lock()
 
         # UI setup
         self.setWindowTitle(ui.window_title)
@@ -72,31 +132,53 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(splitter)
 
+        # Canvas scene rect as plain floats, refreshed on image change; the remote
+        # mouse handler runs per packet and shouldn't call sceneRect() each time.
+        self._scene_left = 0.0
+        self._scene_top = 0.0
+        self._scene_w = 0.0
+        self._scene_h = 0.0
+        self.canvas.scene_rect_changed.connect(self._on_scene_rect_changed)
+
         # --- WebSocket server (Pi -> Laptop) ---
+        # Callbacks run on the server's asyncio thread; they only emit, and the queued
+        # connections deliver on the GUI thread.
         self._ws_bridge = _WsBridge()
-        self._ws_bridge.mouse_pos.connect(self._on_remote_mouse_pos)
-        self._ws_bridge.client_connected.connect(self._on_ws_client_state)
+        self._ws_bridge.mouse_pos.connect(
+            self._on_remote_mouse_pos, Qt.ConnectionType.QueuedConnection
+        )
+        self._ws_bridge.client_connected.connect(
+            self._on_ws_client_state, Qt.ConnectionType.QueuedConnection
+        )
 
         ws_host = os.getenv("WS_HOST", "0.0.0.0")
         ws_port = int(os.getenv("WS_PORT", "8765"))
 
         self._ws_server = WebSocketPositionServer(
             WebSocketServerConfig(host=ws_host, port=ws_port),
-            on_mouse_pos=lambda x, y, w, h: self._ws_bridge.mouse_pos.emit(x, y, w, h),
+            on_mouse_pos=self._ws_bridge.mouse_pos.emit,
             on_client_state=lambda connected: self._ws_bridge.client_connected.emit(bool(connected)),
         )
         self._ws_server.start()
 
         # Wiring: image + overlays
         self.controller.image_changed.connect(self.canvas.set_image)
+        self.controller.detail_image_changed.connect(self.canvas.set_detail_pixmap)
+        self.canvas.detail_needed.connect(self.controller.load_full_resolution)
         self.controller.point_changed.connect(self.canvas.set_point)
         self.controller.grid_config_changed.connect(self.canvas.set_grid_config)
+        self.controller.image_load_failed.connect(self._on_image_load_failed)
 
         # Wiring: choices
         self.controller.choices_updated.connect(self.choices_panel.set_choices)
         self.controller.highlighted_choice_changed.connect(self._on_highlight_changed)
         self.controller.chosen_choice_changed.connect(self._on_chosen_changed)
 
+        # Wiring: LLM crop descriptions
+        self.controller.description_partial.connect(self._on_description_partial)
+        self.controller.description_ready.connect(self._on_description_ready)
+        self.controller.description_failed.connect(self._on_description_failed)
+
         # Mode: update UI + speak mode
         self.controller.choose_mode_changed.connect(self.choices_panel.set_choose_mode)
         self.controller.choose_mode_changed.connect(self._on_mode_changed)
@@ -126,6 +208,13 @@ class MainWindow(QMainWindow):
         state = "connected" if connected else "disconnected"
         self.statusBar().showMessage(f"WebSocket client: {state}")
 
+    @Slot(QRectF)
+    def _on_scene_rect_changed(self, rect: QRectF) -> None:
+        self._scene_left = rect.left()
+        self._scene_top = rect.top()
+        self._scene_w = rect.width()
+        self._scene_h = rect.height()
+
     @Slot(float, float, float, float)
     def _on_remote_mouse_pos(self, x: float, y: float, w: float, h: float) -> None:
         """Receive Pi absolute mouse position in Pi coordinate space (w x h) and
@@ -133,16 +222,16 @@ class MainWindow(QMainWindow):
 
         The ImageCanvas expects points in *image coordinates* (pixmap bounding rect).
         """
-        rect = self.canvas.sceneRect()
-        if rect.isNull() or w <= 0 or h <= 0:
+        if self._scene_w <= 0.0 or self._scene_h <= 0.0 or w <= 0 or h <= 0:
             return
 
         nx = max(0.0, min(1.0, float(x) / float(w)))
         ny = max(0.0, min(1.0, float(y) / float(h)))
 
-        px = rect.left() + nx * rect.width()
-        py = rect.top() + ny * rect.height()
-        self.controller.update_point(QPointF(px, py))
+        self.controller.update_point_xy(
+            self._scene_left + nx * self._scene_w,
+            self._scene_top + ny * self._scene_h,
+        )
 
     # ------------------------
     # ElevenLabs + Windows audio (pygame) plumbing
@@ -150,7 +239,12 @@ class MainWindow(QMainWindow):
     def _get_eleven_client(self):
         if self._eleven_client is not None:
             return self._eleven_client
+        with self._eleven_client_lock:
+            if self._eleven_client is None:
+                self._eleven_client = self._create_eleven_client()
+        return self._eleven_client
 
+    def _create_eleven_client(self):
         api_key = os.getenv("ELEVENLABS_API_KEY")
         if not api_key:
             self._tts_enabled = False
@@ -158,25 +252,64 @@ class MainWindow(QMainWindow):
             return None
 
         try:
+            import httpx
             from elevenlabs.client import ElevenLabs
-            self._eleven_client = ElevenLabs(api_key=api_key)
-            return self._eleven_client
+
+            # One keep-alive pool shared by every speak() so requests skip the TLS handshake
+            http = httpx.Client(
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            )
+            return ElevenLabs(api_key=api_key, httpx_client=http)
         except Exception as e:
             self._tts_enabled = False
             print(f"[TTS] Failed to init ElevenLabs client; disabling TTS. Error: {e}")
             return None
 
+    def _warm_up_tts(self) -> None:
+        """Build the client and open its connection in the background before the first speak()."""
+        if self._tts_warmup_started or not self._tts_enabled:
+            return
+        if os.getenv("ELEVENLABS_WARMUP", "1") == "0":
+            return
+        self._tts_warmup_started = True
+
+        def _worker():
+            client = self._get_eleven_client()
+            if client is None:
+                return
+            try:
+                client.voices.get(self._eleven_voice_id)  # small GET; response unused
+            except Exception as e:
+                print(f"[TTS] Warm-up failed (reason: {e})")
+
+        threading.Thread(target=_worker, daemon=True).start()
+
     def _ensure_pygame_audio(self) -> bool:
         """
-        Initialize pygame mixer once. Uses a conservative config for Windows reliability.
+        Initialize pygame mixer once, mono at the TTS sample rate so speech plays without
+        resampling/upmixing. Buffer stays at 512 samples (~23 ms) for Windows reliability.
         """
         if self._pygame_ready:
             return True
+        if not _HAS_PYGAME:
+            print("[TTS] pygame is not installed; disabling TTS.")
+            self._tts_enabled = False
+            return False
         try:
-            import pygame
             # Pre-init helps reduce latency and avoids some Windows mixer weirdness
-            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
-            pygame.mixer.init()
+            rate = self._tts_sample_rate()
+            pygame.mixer.pre_init(frequency=rate, size=-16, channels=1, buffer=512)
+            # allowedchanges=0: SDL converts to the device instead of changing our format
+            pygame.mixer.init(allowedchanges=0)
+            # Raw PCM can only be handed over as-is if the mixer really runs in its format
+            self._pcm_verbatim = pygame.mixer.get_init() == (rate, -16, 1)
+            # Channel 0 is kept for speech so stop()/play() never touch other sounds
+            pygame.mixer.set_reserved(1)
+            self._tts_channel = pygame.mixer.Channel(0)
+            self._channel_stop = self._tts_channel.stop
+            self._channel_play = self._tts_channel.play
+            self._make_sound = pygame.mixer.Sound
             self._pygame_ready = True
             return True
         except Exception as e:
@@ -184,24 +317,92 @@ class MainWindow(QMainWindow):
             self._tts_enabled = False
             return False
 
-    def _stop_audio_locked(self) -> None:
+    def _shutdown_pygame_audio(self) -> None:
+        """Release the audio device (and the mixer's thread); it restarts on the next speech."""
+        if not self._pygame_ready:
+            return
+        self._pygame_ready = False
+        self._tts_channel = None
+        self._channel_stop = self._channel_play = self._make_sound = None
+        # Decoded Sounds belong to the mixer being closed
+        with self._tts_cache_lock:
+            self._tts_mem_cache.clear()
+        try:
+            pygame.mixer.quit()
+        except Exception:
+            pass
+
+    def _tts_sample_rate(self) -> int:
+        # Output formats look like "mp3_22050_32" / "pcm_24000"
+        try:
+            return int(self._eleven_output_format.split("_")[1])
+        except (IndexError, ValueError):
+            return 22050
+
+    def _pcm_as_wav(self, pcm: bytes) -> io.BytesIO:
+        # ElevenLabs pcm_* is mono signed 16-bit little-endian
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(self._tts_sample_rate())
+            w.writeframes(pcm)
+        buf.seek(0)
+        return buf
+
+    def _stop_audio(self) -> None:
         """
-        Stop any currently playing audio immediately.
-        Must be called while holding self._tts_lock.
+        Stop any currently playing audio immediately (SDL locks the channel internally).
         """
-        if not self._pygame_ready:
+        stop = self._channel_stop
+        if stop is None:
             return
         try:
-            import pygame
-            pygame.mixer.music.stop()
+            stop()
         except Exception:
             pass
 
+    def _tts_cache_key(self, text: str) -> str:
+        raw = f"{self._eleven_voice_id}|{self._eleven_model_id}|{self._eleven_output_format}|{text}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _tts_cache_get(self, key: str):
+        """Decoded Sound for `key` if it is in the in-memory LRU, else None."""
+        with self._tts_cache_lock:
+            sound = self._tts_mem_cache.get(key)
+            if sound is not None:
+                self._tts_mem_cache.move_to_end(key)
+            return sound
+
+    def _tts_cache_read(self, key: str) -> Optional[bytes]:
+        """Audio bytes for `key` from the disk cache, else None."""
+        try:
+            return (self._tts_cache_dir / f"{key}.{self._tts_cache_ext}").read_bytes()
+        except OSError:
+            return None
+
+    def _tts_cache_write(self, key: str, data: bytes) -> None:
+        try:
+            self._tts_cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._tts_cache_dir / f"{key}.{self._tts_cache_ext}"
+            tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[TTS] Failed to cache audio: {e}")
+
+    def _tts_cache_remember(self, key: str, sound) -> None:
+        with self._tts_cache_lock:
+            self._tts_mem_cache[key] = sound
+            self._tts_mem_cache.move_to_end(key)
+            while len(self._tts_mem_cache) > self.TTS_MEM_CACHE_SIZE:
+                self._tts_mem_cache.popitem(last=False)
+
     def speak(self, text: str) -> None:
         """
         Non-blocking TTS.
         - Hard-stops any currently playing audio before starting new.
-        - Latest call wins (older threads self-cancel).
+        - Latest call wins (older requests are dropped or self-cancel).
         """
         if not self._tts_enabled:
             return
@@ -211,63 +412,167 @@ class MainWindow(QMainWindow):
             return
 
         # Cancel previous + stop audio right away
-        with self._tts_lock:
-            self._tts_generation += 1
-            gen = self._tts_generation
-            if self._pygame_ready:
-                self._stop_audio_locked()
+        gen = self._tts_generation = next(self._tts_gen_counter)
+        self._stop_audio()
 
-        def _worker():
-            # Cancel early if something newer came in
-            with self._tts_lock:
-                if gen != self._tts_generation:
-                    return
+        self._tts_submit((gen, text))
 
-            client = self._get_eleven_client()
-            if client is None:
+    def _tts_submit(self, item: Optional[tuple[int, str]]) -> None:
+        # Only the newest request matters: replace anything still waiting
+        while True:
+            try:
+                self._tts_queue.put_nowait(item)
                 return
-
-            if not self._ensure_pygame_audio():
+            except queue.Full:
+                try:
+                    self._tts_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _tts_loop(self) -> None:
+        """Single long-lived TTS worker: synthesizes/plays queued requests one at a time."""
+        while True:
+            item = self._tts_queue.get()
+            if item is None:  # shutdown
                 return
+            if item is _TTS_RELEASE_AUDIO:
+                self._shutdown_pygame_audio()
+                continue
+            self._speak_now(*item)
+
+    def _speak_now(self, gen: int, text: str) -> None:
+        # Cancel early if something newer came in
+        if gen != self._tts_generation:
+            return
 
-            try:
-                audio = client.text_to_speech.convert(
+        try:
+            key = self._tts_cache_key(text)
+            sound = self._tts_cache_get(key)
+            audio_bytes = None if sound is not None else self._tts_cache_read(key)
+            fresh = sound is None and audio_bytes is None
+            if fresh:
+                client = self._get_eleven_client()
+                if client is None:
+                    return
+
+                # elevenlabs 1.x names the streaming call convert_as_stream
+                tts = client.text_to_speech
+                stream = getattr(tts, "stream", None) or tts.convert_as_stream
+                pieces = stream(
                     text=text,
                     voice_id=self._eleven_voice_id,
                     model_id=self._eleven_model_id,
                     output_format=self._eleven_output_format,
                 )
 
-                # SDK may return bytes or an iterator of bytes
-                if not isinstance(audio, (bytes, bytearray)):
-                    audio = b"".join(audio)
-                audio_bytes = bytes(audio)
+                # Raw PCM in the mixer's format starts playing with the first block;
+                # anything else (mp3, converted PCM) is decoded once the clip is complete.
+                if self._tts_is_pcm and self._ensure_pygame_audio() and self._pcm_verbatim:
+                    self._play_pcm_stream(gen, key, pieces)
+                    return
 
-                # Cancel again just before playback, and hard stop current audio
-                with self._tts_lock:
+                chunks = []
+                for chunk in pieces:
                     if gen != self._tts_generation:
                         return
-                    self._stop_audio_locked()
+                    if chunk:
+                        chunks.append(chunk)
+                audio_bytes = b"".join(chunks)
+                if not audio_bytes:
+                    return
+                self._tts_cache_write(key, audio_bytes)
 
-                # Play mp3 bytes via pygame.mixer.music using an in-memory file
-                import io
-                import pygame
+            # Cancel again just before playback, and hard stop current audio
+            if gen != self._tts_generation:
+                return
 
-                bio = io.BytesIO(audio_bytes)
-                pygame.mixer.music.load(bio, namehint="speech.mp3")
-                pygame.mixer.music.play()
+            # The mixer is only started once there is something to play
+            if not self._ensure_pygame_audio():
+                return
+            make_sound, play = self._make_sound, self._channel_play
+            if make_sound is None or play is None:
+                return
+            if sound is None:
+                if self._tts_is_pcm and self._pcm_verbatim:
+                    # Mixer runs mono/16-bit at the format's rate, so samples are used verbatim
+                    sound = make_sound(buffer=audio_bytes)
+                elif self._tts_is_pcm:
+                    # Mixer format differs: a WAV header lets pygame convert the samples
+                    sound = make_sound(file=self._pcm_as_wav(audio_bytes))
+                else:
+                    sound = make_sound(file=io.BytesIO(audio_bytes))  # decode once
+                self._tts_cache_remember(key, sound)
 
-            except Exception as e:
-                print(f"[TTS] Error: {e}")
+            if gen != self._tts_generation:
+                return
+            self._stop_audio()
 
-        threading.Thread(target=_worker, daemon=True).start()
+            # Already-decoded PCM: playback starts without an MP3 decode
+            play(sound)
+
+        except Exception as e:
+            print(f"[TTS] Error: {e}")
+
+    def _play_pcm_stream(self, gen: int, key: str, pieces) -> None:
+        """Play raw PCM while it downloads, then cache the whole clip.
+
+        Blocks of ~TTS_STREAM_BLOCK_S are handed to Channel.queue as they fill. The
+        channel holds one queued Sound, so a block is only queued once the slot is free
+        (an idle channel starts it immediately); meanwhile samples keep accumulating.
+        """
+        channel, make_sound = self._tts_channel, self._make_sound
+        if channel is None or make_sound is None:
+            return
+        block = int(self._tts_sample_rate() * self.TTS_STREAM_BLOCK_S) * 2  # s16 mono
+        received = bytearray()
+        sent = 0  # bytes of `received` already queued
+        started = False
+
+        def queue_pending() -> bool:
+            nonlocal sent, started
+            end = len(received) - (len(received) - sent) % 2  # whole samples only
+            if not started:
+                self._stop_audio()
+                started = True
+            channel.queue(make_sound(buffer=bytes(received[sent:end])))
+            sent = end
+            if gen != self._tts_generation:  # speak() raced the queue call
+                self._stop_audio()
+                return False
+            return True
+
+        for chunk in pieces:
+            if gen != self._tts_generation:
+                return
+            if not chunk:
+                continue
+            received += chunk
+            if len(received) - sent >= block and channel.get_queue() is None:
+                if not queue_pending():
+                    return
+
+        if not received:
+            return
+        self._tts_cache_write(key, bytes(received))
+        self._tts_cache_remember(key, make_sound(buffer=bytes(received)))
+
+        # Tail: wait for the queue slot, then hand over the rest
+        while len(received) - sent >= 2:
+            if gen != self._tts_generation:
+                return
+            if channel.get_queue() is not None:
+                time.sleep(0.01)
+                continue
+            if not queue_pending():
+                return
 
     def _toggle_tts(self) -> None:
         self._tts_enabled = not self._tts_enabled
         if not self._tts_enabled:
-            with self._tts_lock:
-                self._tts_generation += 1
-                self._stop_audio_locked()
+            self._tts_generation = next(self._tts_gen_counter)
+            self._stop_audio()
+            # The worker may be inside _speak_now with the mixer; let it close it in turn
+            self._tts_submit(_TTS_RELEASE_AUDIO)
         self.statusBar().showMessage(f"TTS: {'ON' if self._tts_enabled else 'OFF'}")
         print(f"[TTS] {'ENABLED' if self._tts_enabled else 'DISABLED'}")
 
@@ -282,6 +587,7 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(f"Mode: {mode}")
             return
         self._last_choosing_state = choosing
+        self._hl_timer.stop()
 
         mode = "CHOOSING" if choosing else "RUNNING"
         print(f"[TTS] MODE: {mode}")
@@ -291,8 +597,12 @@ class MainWindow(QMainWindow):
             # Suppress immediate highlight TTS triggered by entering choose mode
             self._suppress_next_highlight_tts = True
 
-        # Speak mode change (no overlap due to hard-stop in speak())
-        self.speak(f"Mode: {mode}")
+        # One utterance per transition (see _fire_mode_announcement)
+        self._pending_mode_text = "Choosing mode." if choosing else "Running mode."
+        self._mode_tts_timer.start()
+
+    def _fire_mode_announcement(self) -> None:
+        self.speak(self._pending_mode_text)
 
     @Slot(int)
     def _on_highlight_changed(self, idx: int) -> None:
@@ -302,14 +612,25 @@ class MainWindow(QMainWindow):
             self._suppress_next_highlight_tts = False
             return
 
+        # Restart the debounce; holding an arrow key only speaks the final item.
+        # The label is captured now so a later choices update can't change what's said.
         item = self.choices_panel.list.item(idx) if idx >= 0 else None
-        if item is not None and self.controller.is_choosing():
-            text = item.text()
+        if item is None:
+            self._hl_timer.stop()
+            return
+        self._pending_highlight_text = item.text()
+        self._hl_timer.start(self.HIGHLIGHT_DEBOUNCE_MS)
+
+    def _fire_highlight(self) -> None:
+        text = self._pending_highlight_text
+        if text and self.controller.is_choosing():
             print(f"[TTS] {text}")
             self.speak(text)
 
     @Slot(int, str)
     def _on_chosen_changed(self, idx: int, text: str) -> None:
+        self._hl_timer.stop()
+        self._mode_tts_timer.stop()  # "Chosen. X" already implies running mode
         self.choices_panel.set_chosen_index(idx)
         self.statusBar().showMessage(f"Chosen: {idx} — {text}")
         print(f"[TTS] CHOSEN: {text}")
@@ -319,82 +640,69 @@ class MainWindow(QMainWindow):
         if not self.controller.is_choosing():
             self.controller.enter_choose_mode()
             self.choices_panel.list.setFocus()
-            self.speak("Choosing mode.")
         else:
             self.controller.confirm_choice()
 
     def showEvent(self, event):
         super().showEvent(event)
+        self._warm_up_tts()
         try:
-            self.controller.load_initial_image()
+            self.controller.load_initial_image(self._canvas_target_size())
             self.choices_panel.list.setFocus()
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    def _canvas_target_size(self) -> QSize:
+        """Canvas viewport size in device pixels (decode target for the image)."""
+        dpr = self.canvas.devicePixelRatioF()
+        vp = self.canvas.viewport().size()
+        return QSize(max(1, int(vp.width() * dpr)), max(1, int(vp.height() * dpr)))
+
+    @Slot(str)
+    def _on_image_load_failed(self, message: str) -> None:
+        QMessageBox.critical(self, "Error", message)
+
     def _demo_move_point(self) -> None:
         row = self.choices_panel.list.currentRow()
         offsets = [(80, 80), (220, 140), (340, 260), (420, 190)]
         x, y = offsets[row % len(offsets)] if row >= 0 else (60, 60)
+        # Offsets are in source pixels; the image may be decoded smaller
+        s = self.controller.image_scale()
         from PySide6.QtCore import QPointF
-        self.controller.update_point(QPointF(x, y))
+        self.controller.update_point(QPointF(x * s, y * s))
 
 
     # ------------------------
     # LLM crop description (Shift)
     # ------------------------
-    def _get_llm_agent(self):
-        if self._llm_agent is not None:
-            return self._llm_agent
-        try:
-            from agents.llm_agent import LlmAgent, LlmAgentConfig
-            # You can override model/prompt via env if desired
-            model_name = os.getenv("GEMINI_MODEL_NAME", "gemini-2.5-flash")
-            prompt = os.getenv(
-                "GEMINI_CROP_PROMPT",
-                "Describe this cropped image region in 2 to 4 short sentences. "
-                "Focus on what is visually present and any important textures/patterns.",
-            )
-            self._llm_agent = LlmAgent(LlmAgentConfig(model_name=model_name, default_prompt=prompt))
-            return self._llm_agent
-        except Exception as e:
-            print(f"[LLM] Disabled (reason: {e})")
-            return None
-
     def _describe_current_crop(self) -> None:
         """Crop 256x256 around the marker and speak a short description."""
-        crop = self.canvas.crop_around_point(size=256)
-        if crop is None:
+        point = self.canvas.current_point()
+        if point is None:
             self.statusBar().showMessage("No crop available yet.")
             return
 
-        # Save to a temp PNG (Gemini SDK + PIL are simplest with a file path)
-        try:
-            tmp_dir = Path(tempfile.gettempdir())
-            out_path = tmp_dir / "crop_256.png"
-            crop.save(str(out_path), "PNG")
-        except Exception as e:
-            print(f"[LLM] Failed to save crop: {e}")
-            return
-
-        agent = self._get_llm_agent()
-        if agent is None:
+        # The controller cuts the region from the source file at full resolution
+        if not self.controller.describe_around_point(point, size=256):
             self.statusBar().showMessage("LLM not configured (check GOOGLE_API_KEY + deps).")
-            return
 
-        def _worker():
-            try:
-                text = agent.describe_image(str(out_path))
-                if text:
-                    print(f"[LLM] {text}")
-                    self.statusBar().showMessage("LLM: described crop")
-                    self.speak(text)
-                else:
-                    self.statusBar().showMessage("LLM returned empty description.")
-            except Exception as e:
-                print(f"[LLM] Error: {e}")
-                self.statusBar().showMessage("LLM error (see console).")
+    @Slot(str)
+    def _on_description_partial(self, text: str) -> None:
+        self.statusBar().showMessage(f"LLM: {text}")
 
-        threading.Thread(target=_worker, daemon=True).start()
+    @Slot(str)
+    def _on_description_ready(self, text: str) -> None:
+        if text:
+            print(f"[LLM] {text}")
+            self.statusBar().showMessage("LLM: described crop")
+            self.speak(text)
+        else:
+            self.statusBar().showMessage("LLM returned empty description.")
+
+    @Slot(str)
+    def _on_description_failed(self, message: str) -> None:
+        print(f"[LLM] Error: {message}")
+        self.statusBar().showMessage("LLM error (see console).")
 
     def keyPressEvent(self, event):
         # SHIFT: describe cropped region around the marker
@@ -414,4 +722,12 @@ class MainWindow(QMainWindow):
                 self._ws_server.stop()
         except Exception:
             pass
+
+        # Cancel speech and let the TTS worker exit; drop queued LLM work
+        self._hl_timer.stop()
+        self._mode_tts_timer.stop()
+        self._tts_generation = next(self._tts_gen_counter)
+        self._stop_audio()
+        self._tts_submit(None)
+        self.controller.shutdown()
         return super().closeEvent(event)
\ No newline at end of file
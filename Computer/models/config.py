@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GridConfig:
     """Grid definition in *image coordinates*.
 
@@ -14,7 +14,7 @@ class GridConfig:
     line_width: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UiConfig:
     window_title: str = "Grid UI Prototype"
     window_width: int = 1100
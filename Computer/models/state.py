@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from .config import GridConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     image_path: str
     choices: List[str]
     grid: GridConfig = GridConfig()
+    # Memoized Path for image_path (rebuilt only if image_path is reassigned)
+    _image_file: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    _image_file_src: str = field(default="", init=False, repr=False, compare=False)
 
     def image_file(self) -> Path:
-        return Path(self.image_path)
+        if self._image_file is None or self._image_file_src != self.image_path:
+            self._image_file = Path(self.image_path)
+            self._image_file_src = self.image_path
+        return self._image_file
@@ -3,20 +3,40 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import struct
 import threading
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import websockets
 
+try:
+    import orjson  # much faster parse for the per-packet mouse_pos frames
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import uvloop  # libuv-based loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 
 logger = logging.getLogger(__name__)
 
+# Binary mouse_pos frame sent by the Pi: type byte 0x01, then x, y, w, h as
+# big-endian float32 (17 bytes). Must match RaspberryPi/network/ws_client.py.
+MSG_MOUSE_POS = 0x01
+MOUSE_POS_FRAME = struct.Struct("!Bffff")
+
 
 @dataclass(frozen=True)
 class WebSocketServerConfig:
     host: str = "0.0.0.0"
     port: int = 8765
+    # mouse_pos callbacks are coalesced to at most this rate (latest position wins); 0 = every frame
+    max_callback_hz: float = 120.0
 
 
 class WebSocketPositionServer:
@@ -24,7 +44,8 @@ class WebSocketPositionServer:
     Simple WebSocket server for receiving position updates from the Raspberry Pi.
 
     Runs its own asyncio loop in a background thread.
-    Calls `on_mouse_pos(x, y, w, h)` on each received mouse_pos message.
+    Calls `on_mouse_pos(x, y, w, h)` with the latest received position, at most
+    `cfg.max_callback_hz` times per second.
     """
 
     def __init__(
@@ -40,6 +61,11 @@ class WebSocketPositionServer:
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._stop_evt = threading.Event()
+        self._async_stop: Optional[asyncio.Event] = None  # created on the server loop
+
+        # Latest unsent position + wake-up for the delivery task (loop thread only)
+        self._latest: Optional[Tuple[float, float, float, float]] = None
+        self._pos_evt: Optional[asyncio.Event] = None
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -50,13 +76,18 @@ class WebSocketPositionServer:
 
     def stop(self) -> None:
         self._stop_evt.set()
-        if self._loop:
-            self._loop.call_soon_threadsafe(self._loop.stop)
+        loop, evt = self._loop, self._async_stop
+        if loop is not None and evt is not None:
+            try:
+                loop.call_soon_threadsafe(evt.set)
+            except RuntimeError:
+                pass  # loop already closed
         if self._thread:
             self._thread.join(timeout=1.0)
 
     def _thread_main(self) -> None:
-        self._loop = asyncio.new_event_loop()
+        # uvloop for this thread only; a global policy would also change other asyncio.run() users
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         try:
             self._loop.run_until_complete(self._serve())
@@ -69,21 +100,79 @@ class WebSocketPositionServer:
                 pass
 
     async def _serve(self) -> None:
-        async with websockets.serve(self._handler, self.cfg.host, self.cfg.port, max_queue=64):
-            logger.info("WebSocket server listening on ws://%s:%s", self.cfg.host, self.cfg.port)
-            # run until stop
-            while not self._stop_evt.is_set():
-                await asyncio.sleep(0.2)
+        self._async_stop = asyncio.Event()
+        if self._stop_evt.is_set():  # stop() ran before the event existed
+            return
+        deliver = None
+        if self.cfg.max_callback_hz > 0:
+            self._pos_evt = asyncio.Event()
+            deliver = asyncio.create_task(self._deliver_positions(1.0 / self.cfg.max_callback_hz))
+        try:
+            # Frames are tiny: permessage-deflate only costs CPU, and nothing legit exceeds 32 KiB
+            async with websockets.serve(
+                self._handler,
+                self.cfg.host,
+                self.cfg.port,
+                max_queue=64,
+                compression=None,
+                max_size=2**15,
+            ):
+                logger.info("WebSocket server listening on ws://%s:%s", self.cfg.host, self.cfg.port)
+                # run until stop() sets the event (no polling)
+                await self._async_stop.wait()
+        finally:
+            if deliver is not None:
+                deliver.cancel()
+
+    async def _deliver_positions(self, period_s: float) -> None:
+        """Forward only the newest position, then wait one period before the next."""
+        evt = self._pos_evt
+        assert evt is not None
+        while True:
+            await evt.wait()
+            evt.clear()
+            pos = self._latest
+            self._latest = None
+            if pos is not None:
+                try:
+                    self._on_mouse_pos(*pos)
+                except Exception:
+                    # A failing callback must not end delivery for the whole session
+                    logger.exception("mouse_pos callback failed")
+            await asyncio.sleep(period_s)
+
+    def _push_position(self, x: float, y: float, w: float, h: float) -> None:
+        if self._pos_evt is None:
+            self._on_mouse_pos(x, y, w, h)
+            return
+        self._latest = (x, y, w, h)
+        self._pos_evt.set()
 
     async def _handler(self, websocket: websockets.WebSocketServerProtocol) -> None:
         peer = getattr(websocket, "remote_address", None)
         logger.info("Client connected: %s", peer)
         if self._on_client_state:
             self._on_client_state(True)
+        on_mouse_pos = self._push_position
+        frame_size = MOUSE_POS_FRAME.size
+        unpack_from = MOUSE_POS_FRAME.unpack_from
+        recv = websocket.recv
         try:
-            async for message in websocket:
+            # Plain recv() loop: one await per frame, no async-iterator machinery on top
+            while True:
+                try:
+                    message = await recv()
+                except websockets.ConnectionClosedOK:
+                    break
+
+                # Fast path: fixed binary frame, no JSON at all
+                if isinstance(message, bytes) and len(message) == frame_size and message[0] == MSG_MOUSE_POS:
+                    _, x, y, w, h = unpack_from(message)
+                    on_mouse_pos(x, y, w, h)
+                    continue
+
                 try:
-                    obj = json.loads(message)
+                    obj = _json_loads(message)
                 except Exception:
                     continue
 
@@ -93,7 +182,7 @@ class WebSocketPositionServer:
                     y = float(obj.get("y", 0))
                     w = float(obj.get("w", 1))
                     h = float(obj.get("h", 1))
-                    self._on_mouse_pos(x, y, w, h)
+                    on_mouse_pos(x, y, w, h)
                 elif msg_type == "hello":
                     logger.info("Hello: %s", obj)
                 else:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QLabel, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
 
 
@@ -24,8 +25,14 @@ class ChoicesPanel(QWidget):
         self.list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
 
         self._chosen_index: Optional[int] = None
+        # Row currently drawn as chosen, so a change only restyles the old and new rows
+        self._styled_index: Optional[int] = None
         self._choosing: bool = False
 
+        self._font_regular = QFont()
+        self._font_bold = QFont(self._font_regular)
+        self._font_bold.setBold(True)
+
         self.set_choices(choices)
 
         self.list.itemClicked.connect(self._on_item_clicked)
@@ -37,19 +44,32 @@ class ChoicesPanel(QWidget):
         self._apply_mode_visuals()
 
     def set_choices(self, choices: List[str]) -> None:
-        self.list.clear()
-        for c in choices:
-            self.list.addItem(QListWidgetItem(c))
-        if self.list.count() > 0:
-            self.list.setCurrentRow(0)
+        # One batched insert, with repaints and intermediate signals suppressed
+        lst = self.list
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            lst.clear()
+            lst.addItems(list(choices))
+            n = lst.count()
+            item, style = lst.item, self._style_item
+            for i in range(n):
+                style(item(i), chosen=False)
+            if n > 0:
+                lst.setCurrentRow(0)
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
+        self._styled_index = None
         self._chosen_index = None
         self._refresh_chosen_visual()
 
     def set_highlighted_index(self, row: int) -> None:
-        if row < 0 or row >= self.list.count():
+        lst = self.list
+        if row < 0 or row >= lst.count():
             return
-        self.list.setCurrentRow(row)
-        self.list.scrollToItem(self.list.item(row))
+        lst.setCurrentRow(row)
+        lst.scrollToItem(lst.item(row))
 
     def set_chosen_index(self, row: int) -> None:
         self._chosen_index = row
@@ -68,23 +88,30 @@ class ChoicesPanel(QWidget):
 
         self._refresh_chosen_visual()
 
-    def _refresh_chosen_visual(self) -> None:
-        for i in range(self.list.count()):
-            it = self.list.item(i)
-            it.setBackground(Qt.GlobalColor.transparent)
+    def _style_item(self, it: QListWidgetItem, chosen: bool) -> None:
+        it.setBackground(Qt.GlobalColor.transparent)
+        if chosen:
+            it.setFont(self._font_bold)
+            it.setForeground(Qt.GlobalColor.green)
+        else:
+            it.setFont(self._font_regular)
             it.setForeground(Qt.GlobalColor.white)
-            f = it.font()
-            f.setBold(False)
-            it.setFont(f)
 
-        if self._chosen_index is None:
+    def _refresh_chosen_visual(self) -> None:
+        lst = self.list
+        n = lst.count()
+        chosen = self._chosen_index
+        if chosen is not None and not 0 <= chosen < n:
+            chosen = None
+        if chosen == self._styled_index:
             return
-        if 0 <= self._chosen_index < self.list.count():
-            it = self.list.item(self._chosen_index)
-            f = it.font()
-            f.setBold(True)
-            it.setFont(f)
-            it.setForeground(Qt.GlobalColor.green)
+
+        prev = self._styled_index
+        if prev is not None and prev < n:
+            self._style_item(lst.item(prev), chosen=False)
+        if chosen is not None:
+            self._style_item(lst.item(chosen), chosen=True)
+        self._styled_index = chosen
 
     def _on_item_clicked(self, item: QListWidgetItem) -> None:
         row = self.list.row(item)
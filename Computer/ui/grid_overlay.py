@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
 from typing import Optional, Tuple
 
 from PySide6.QtCore import QPointF, QRectF, Qt
-from PySide6.QtGui import QBrush, QPen
-from PySide6.QtWidgets import QGraphicsLineItem, QGraphicsRectItem, QGraphicsScene
+from PySide6.QtGui import QBrush, QPainterPath, QPen
+from PySide6.QtWidgets import QGraphicsPathItem, QGraphicsRectItem, QGraphicsScene
 
 
-@dataclass
-class ActiveCell:
-    row: int
-    col: int
-    rect: QRectF
+def _grid_edges(start: float, length: float, n: int) -> list[float]:
+    """n + 1 evenly spaced coordinates from `start` to `start + length`."""
+    step = length / n
+    return [start + i * step for i in range(n + 1)]
 
 
 class GridOverlay:
@@ -26,9 +25,16 @@ class GridOverlay:
         self._rows = 1
         self._cols = 1
         self._bounds: QRectF | None = None
+        # Line/cell edges in image coordinates, computed once per config; cell lookup
+        # bisects these, so they need not be evenly spaced
+        self._xs: list[float] = []
+        self._ys: list[float] = []
 
-        self._line_items: list[QGraphicsLineItem] = []
+        # All grid lines live in one path item: one paint call and one index entry
+        self._lines_item: QGraphicsPathItem | None = None
         self._active_rect_item: QGraphicsRectItem | None = None
+        # (row, col) currently shown by _active_rect_item; moves within it skip the scene update
+        self._last_cell: Tuple[int, int] | None = None
 
         # Pens/brushes are intentionally centralized for easy theming
         self._grid_pen = QPen(Qt.GlobalColor.white)
@@ -47,12 +53,19 @@ class GridOverlay:
         self._rows = max(1, int(rows))
         self._cols = max(1, int(cols))
         self._bounds = bounds
+        self._xs = _grid_edges(bounds.left(), bounds.width(), self._cols)
+        self._ys = _grid_edges(bounds.top(), bounds.height(), self._rows)
         self._rebuild()
 
+    def set_bounds(self, bounds: QRectF) -> None:
+        """Re-fit the current rows/cols to new image bounds."""
+        self.set_config(self._rows, self._cols, bounds)
+
     def clear(self) -> None:
-        for item in self._line_items:
-            self._scene.removeItem(item)
-        self._line_items.clear()
+        self._last_cell = None
+        if self._lines_item is not None:
+            self._scene.removeItem(self._lines_item)
+            self._lines_item = None
 
         if self._active_rect_item is not None:
             self._scene.removeItem(self._active_rect_item)
@@ -63,23 +76,25 @@ class GridOverlay:
         if self._bounds is None:
             return
 
-        b = self._bounds
-        w = b.width()
-        h = b.height()
+        top, bottom = self._ys[0], self._ys[-1]
+        left, right = self._xs[0], self._xs[-1]
+        path = QPainterPath()
+        move_to, line_to = path.moveTo, path.lineTo
 
         # Vertical lines
-        for c in range(1, self._cols):
-            x = b.left() + w * (c / self._cols)
-            li = self._scene.addLine(x, b.top(), x, b.bottom(), self._grid_pen)
-            li.setZValue(5)
-            self._line_items.append(li)
+        for x in self._xs[1:-1]:
+            move_to(x, top)
+            line_to(x, bottom)
 
         # Horizontal lines
-        for r in range(1, self._rows):
-            y = b.top() + h * (r / self._rows)
-            li = self._scene.addLine(b.left(), y, b.right(), y, self._grid_pen)
-            li.setZValue(5)
-            self._line_items.append(li)
+        for y in self._ys[1:-1]:
+            move_to(left, y)
+            line_to(right, y)
+
+        self._lines_item = QGraphicsPathItem(path)
+        self._lines_item.setPen(self._grid_pen)
+        self._lines_item.setZValue(5)
+        self._scene.addItem(self._lines_item)
 
         # Active cell rect (initially hidden until first point)
         self._active_rect_item = QGraphicsRectItem()
@@ -89,36 +104,24 @@ class GridOverlay:
         self._active_rect_item.setVisible(False)
         self._scene.addItem(self._active_rect_item)
 
-    def cell_for_point(self, p: QPointF) -> Optional[ActiveCell]:
-        if self._bounds is None:
-            return None
-
-        b = self._bounds
-        x = min(max(p.x(), b.left()), b.right() - 1e-6)
-        y = min(max(p.y(), b.top()), b.bottom() - 1e-6)
+    def _cell_index(self, p: QPointF) -> Tuple[int, int]:
+        # Points on/after the last edge land in the last cell, before the first in cell 0
+        col = min(max(bisect_right(self._xs, p.x()) - 1, 0), self._cols - 1)
+        row = min(max(bisect_right(self._ys, p.y()) - 1, 0), self._rows - 1)
+        return row, col
 
-        col = int((x - b.left()) / b.width() * self._cols)
-        row = int((y - b.top()) / b.height() * self._rows)
-
-        col = min(max(col, 0), self._cols - 1)
-        row = min(max(row, 0), self._rows - 1)
-
-        cell_w = b.width() / self._cols
-        cell_h = b.height() / self._rows
-
-        rect = QRectF(
-            b.left() + col * cell_w,
-            b.top() + row * cell_h,
-            cell_w,
-            cell_h,
-        )
-        return ActiveCell(row=row, col=col, rect=rect)
-
-    def set_active_cell_from_point(self, p: QPointF) -> Optional[ActiveCell]:
-        cell = self.cell_for_point(p)
-        if cell is None or self._active_rect_item is None:
+    def set_active_cell_from_point(self, p: QPointF) -> Optional[Tuple[int, int]]:
+        """Highlight the cell containing `p` and return its (row, col)."""
+        if self._bounds is None or self._active_rect_item is None:
             return None
 
-        self._active_rect_item.setRect(cell.rect)
+        cell = self._cell_index(p)
+        if cell == self._last_cell:
+            return cell  # same cell: nothing to invalidate
+
+        row, col = cell
+        xs, ys = self._xs, self._ys
+        self._active_rect_item.setRect(xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row])
         self._active_rect_item.setVisible(True)
+        self._last_cell = cell
         return cell
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import QPointF, Slot, Qt, QRect, QRectF
-from PySide6.QtGui import QPainter, QPixmap, QImage
+from PySide6.QtCore import QPointF, QTimer, Signal, Slot, Qt, QRectF
+from PySide6.QtGui import QPainter, QPixmap
 from PySide6.QtWidgets import (
     QGraphicsEllipseItem,
+    QGraphicsItem,
     QGraphicsPixmapItem,
     QGraphicsScene,
     QGraphicsView,
@@ -20,20 +21,32 @@ class ImageCanvas(QGraphicsView):
     Coordinates for point/grid are in *image coordinates* (i.e., the pixmap's scene rect).
     """
 
+    # Emitted when a new image sets the scene rect (image coordinates)
+    scene_rect_changed = Signal(QRectF)
+    # Emitted once per image when zooming magnifies the pixmap past 1 device pixel per pixel
+    detail_needed = Signal()
+
     def __init__(self):
         super().__init__()
         self.setScene(QGraphicsScene(self))
 
-        self.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        # No Antialiasing: the only vector items are cosmetic 1px grid lines and the marker
         self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
 
         self._pix_item: Optional[QGraphicsPixmapItem] = None
+        # Image bounds in image coordinates; stays put when a detail pixmap is swapped in
+        self._image_rect = QRectF()
+        self._detail_requested = False
+        # Wheel steps accumulated since the last applied scale (see wheelEvent)
+        self._pending_scale = 1.0
 
         # Dynamic point marker
         self._marker: Optional[QGraphicsEllipseItem] = None
 
         # Last known marker point in image coordinates
         self._current_point: Optional[QPointF] = None
+        # Rounded (x, y) of that point; repeats of it are dropped in set_point
+        self._point_key: Optional[tuple[float, float]] = None
 
         # Grid overlay manager
         self._grid = GridOverlay(self.scene())
@@ -43,42 +56,68 @@ class ImageCanvas(QGraphicsView):
 
     @Slot(QPixmap)
     def set_image(self, pixmap: QPixmap) -> None:
-        self.scene().clear()
-        self._pix_item = self.scene().addPixmap(pixmap)
-        self._pix_item.setZValue(0)
-
-        # Overlay marker
-        r = 6
-        self._marker = QGraphicsEllipseItem(-r, -r, 2 * r, 2 * r)
-        self._marker.setZValue(10)
-        self._marker.setBrush(Qt.GlobalColor.red)
-        self._marker.setPen(Qt.PenStyle.NoPen)
-        self.scene().addItem(self._marker)
-
-        self.setSceneRect(self._pix_item.boundingRect())
+        self._point_key = None
+        if self._pix_item is None:
+            self._pix_item = self.scene().addPixmap(pixmap)
+            self._pix_item.setZValue(0)
+            # Hit-testing by bounding rect; the default mask shape is built from the pixels.
+            self._pix_item.setShapeMode(QGraphicsPixmapItem.ShapeMode.BoundingRectShape)
+
+            # Overlay marker
+            r = 6
+            self._marker = QGraphicsEllipseItem(-r, -r, 2 * r, 2 * r)
+            self._marker.setZValue(10)
+            self._marker.setBrush(Qt.GlobalColor.red)
+            self._marker.setPen(Qt.PenStyle.NoPen)
+            # Constant on-screen size at any zoom, so it stays crisp without antialiasing
+            self._marker.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations, True)
+            self.scene().addItem(self._marker)
+        else:
+            # Later images: swap the pixmap, keep the marker and grid items alive
+            self._pix_item.setScale(1.0)
+            self._pix_item.setPixmap(pixmap)
+
+        self._image_rect = self._pix_item.boundingRect()
+        self._detail_requested = False
+        self.setSceneRect(self._image_rect)
         self.fitInView(self.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        self._pending_scale = 1.0
+        self.scene_rect_changed.emit(self.sceneRect())
 
-        # Rebuild grid with current config (defaults to 1x1 until set_grid_config called)
-        self._grid.set_config(1, 1, self._pix_item.boundingRect())
+        # Fit the grid to the new bounds, keeping its rows/cols (1x1 until set_grid_config)
+        self._grid.set_bounds(self._image_rect)
 
         # initial marker/active-cell
         self.set_point(QPointF(50, 50))
 
+    @Slot(QPixmap)
+    def set_detail_pixmap(self, pixmap: QPixmap) -> None:
+        """Show a higher-resolution copy of the current image in the same image coordinates."""
+        if self._pix_item is None or pixmap.width() <= self._image_rect.width():
+            return
+        self._pix_item.setPixmap(pixmap)
+        self._pix_item.setScale(self._image_rect.width() / pixmap.width())
+
     @Slot(int, int)
     def set_grid_config(self, rows: int, cols: int) -> None:
         if not self._pix_item:
             return
-        self._grid.set_config(rows, cols, self._pix_item.boundingRect())
+        self._grid.set_config(rows, cols, self._image_rect)
+        self._point_key = None  # the rebuilt grid has no highlight yet
 
     @Slot(QPointF)
     def set_point(self, pos: QPointF) -> None:
         if not self._pix_item or not self._marker:
             return
 
-        rect = self._pix_item.boundingRect()
+        rect = self._image_rect
 
         x = min(max(pos.x(), rect.left()), rect.right())
         y = min(max(pos.y(), rect.top()), rect.bottom())
+        key = (round(x, 2), round(y, 2))
+        if key == self._point_key:
+            return  # same spot as last time: marker and highlight are already there
+        self._point_key = key
         p = QPointF(x, y)
 
         # Move marker and update active cell highlight
@@ -92,57 +131,19 @@ class ImageCanvas(QGraphicsView):
         """Return the last point set on the canvas (image coordinates)."""
         return self._current_point
 
-    def crop_around_point(self, size: int = 256) -> Optional[QImage]:
-        """Crop a square QImage of `size` x `size` around the current point.
-
-        - The crop is centered on the red marker.
-        - If the crop rectangle goes out of bounds, the missing area is padded with black.
-        """
-        if not self._pix_item or self._current_point is None:
-            return None
-
-        pix = self._pix_item.pixmap()
-        if pix.isNull():
-            return None
-
-        src_img = pix.toImage().convertToFormat(QImage.Format.Format_RGBA8888)
-
-        w = src_img.width()
-        h = src_img.height()
-        if w <= 0 or h <= 0:
-            return None
-
-        half = int(size // 2)
-        cx = int(round(self._current_point.x()))
-        cy = int(round(self._current_point.y()))
-
-        # Desired source rect (may be out of bounds)
-        src_rect = QRect(cx - half, cy - half, int(size), int(size))
-
-        # Intersect with actual image bounds
-        bounds = QRect(0, 0, w, h)
-        intersect = src_rect.intersected(bounds)
-
-        # Target image (padded)
-        out = QImage(int(size), int(size), QImage.Format.Format_RGBA8888)
-        out.fill(Qt.GlobalColor.black)
-
-        if intersect.isEmpty():
-            return out
-
-        # Where to place the intersected patch in the output
-        dx = int(intersect.x() - src_rect.x())
-        dy = int(intersect.y() - src_rect.y())
-
-        painter = QPainter(out)
-        try:
-            painter.drawImage(QRect(dx, dy, intersect.width(), intersect.height()), src_img, intersect)
-        finally:
-            painter.end()
-
-        return out
-
-
     def wheelEvent(self, event):
+        # Coalesce bursts of wheel/trackpad events into one scale() per event-loop pass
         factor = 1.15 if event.angleDelta().y() > 0 else (1 / 1.15)
+        if self._pending_scale == 1.0:
+            QTimer.singleShot(0, self._apply_scale)
+        self._pending_scale *= factor
+
+    def _apply_scale(self) -> None:
+        factor = self._pending_scale
+        self._pending_scale = 1.0
+        if factor == 1.0:
+            return
         self.scale(factor, factor)
+        if not self._detail_requested and self.transform().m11() * self.devicePixelRatioF() > 1.0:
+            self._detail_requested = True
+            self.detail_needed.emit()
@@ -0,0 +1,229 @@
+"""
+Exact-match cache for LLM responses.
+
+Key = sha256(model name + prompt + image bytes). Entries live in a small in-process
+LRU and as one JSON file per key under `<IMAGE_CONFIG.cache_dir>/<LLM_CACHE_CONFIG.subdir>`,
+so repeated analyses of the same image/prompt skip the Gemini call, also across restarts.
+
+Second tier (`similar_get` / `similar_set`): parsed results keyed by a 64-bit dHash of
+the image in `<cache_dir>/phash_cache.sqlite`. A lookup accepts an entry for the same
+model + prompt + pixel size within `LLM_CACHE_CONFIG.phash_max_distance` bits (at most
+3), so re-encoded copies of an image still hit. Set the distance to -1 to turn it off.
+
+Disable with LLM_CACHE_CONFIG.enabled = False or env LLM_CACHE=0.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+from config import IMAGE_CONFIG, LLM_CACHE_CONFIG
+
+
+_lock = threading.Lock()
+_memory: "OrderedDict[str, tuple[float, str]]" = OrderedDict()  # key -> (created, text)
+
+
+def enabled() -> bool:
+    return LLM_CACHE_CONFIG.enabled and os.getenv("LLM_CACHE", "1") != "0"
+
+
+def make_key(model_name: str, prompt: str, image_bytes: bytes) -> str:
+    h = hashlib.sha256()
+    for part in (model_name.encode("utf-8"), prompt.encode("utf-8"), image_bytes):
+        # length-prefix each part so different splits can't collide
+        h.update(len(part).to_bytes(8, "big"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def _path(key: str) -> Path:
+    cache_dir = os.getenv("CACHE_DIR", IMAGE_CONFIG.cache_dir)
+    return Path(cache_dir) / LLM_CACHE_CONFIG.subdir / f"{key}.json"
+
+
+def _expired(created: float) -> bool:
+    ttl = LLM_CACHE_CONFIG.ttl_s
+    return ttl > 0 and (time.time() - created) > ttl
+
+
+def _remember(key: str, created: float, text: str) -> None:
+    # caller holds _lock
+    _memory[key] = (created, text)
+    _memory.move_to_end(key)
+    while len(_memory) > LLM_CACHE_CONFIG.memory_entries:
+        _memory.popitem(last=False)
+
+
+def get(key: str) -> Optional[str]:
+    """Cached response text for `key`, or None (missing, expired, unreadable or disabled)."""
+    if not enabled():
+        return None
+
+    with _lock:
+        hit = _memory.get(key)
+        if hit is not None:
+            if not _expired(hit[0]):
+                _memory.move_to_end(key)
+                return hit[1]
+            del _memory[key]
+
+    try:
+        entry = json.loads(_path(key).read_text(encoding="utf-8"))
+        created = float(entry["created"])
+        text = entry["text"]
+    except Exception:
+        return None
+    if not isinstance(text, str) or _expired(created):
+        return None
+
+    with _lock:
+        _remember(key, created, text)
+    return text
+
+
+def set(key: str, value: str) -> None:
+    """Store a response; disk write failures only cost the persistence."""
+    if not enabled() or not isinstance(value, str):
+        return
+
+    created = time.time()
+    with _lock:
+        _remember(key, created, value)
+
+    path = _path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"created": created, "text": value}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)  # atomic: readers never see a half-written entry
+    except OSError:
+        pass
+
+
+# --------------------------- Perceptual (dHash) tier ---------------------------
+
+_U64 = 1 << 64
+
+# The hash is stored as 4 indexed 16-bit bands. Two hashes at most 3 bits apart share
+# at least one band, so a lookup only reads rows matching one of its bands.
+_BANDS = 4
+_MAX_DISTANCE = _BANDS - 1
+
+# (dHash, width, height) of an image
+Fingerprint = Tuple[int, int, int]
+
+_db_lock = threading.Lock()
+_db: Optional[sqlite3.Connection] = None
+
+
+def fingerprint(image_path: str) -> Fingerprint:
+    """64-bit difference hash (9x8 grayscale thumbnail, one bit per left<right pixel pair) + size."""
+    with Image.open(image_path) as img:
+        size = img.size
+        px = list(img.convert("L").resize((9, 8), Image.BILINEAR).getdata())
+    bits = 0
+    for row in range(8):
+        base = row * 9
+        for col in range(8):
+            bits = (bits << 1) | (px[base + col] < px[base + col + 1])
+    return bits, size[0], size[1]
+
+
+def _bands(phash: int) -> Tuple[int, ...]:
+    return tuple((phash >> (16 * i)) & 0xFFFF for i in range(_BANDS))
+
+
+def _connection() -> sqlite3.Connection:
+    # caller holds _db_lock; one connection for the process, shared by all threads
+    global _db
+    if _db is None:
+        cache_dir = Path(os.getenv("CACHE_DIR", IMAGE_CONFIG.cache_dir))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(cache_dir / "phash_cache.sqlite", check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS phash_entries ("
+            " phash INTEGER NOT NULL, b0 INTEGER NOT NULL, b1 INTEGER NOT NULL,"
+            " b2 INTEGER NOT NULL, b3 INTEGER NOT NULL,"
+            " width INTEGER NOT NULL, height INTEGER NOT NULL,"
+            " model TEXT NOT NULL, prompt TEXT NOT NULL,"
+            " created REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        for band in range(_BANDS):
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS phash_entries_b{band}"
+                f" ON phash_entries (model, prompt, width, height, b{band})"
+            )
+        conn.commit()
+        _db = conn
+    return _db
+
+
+def _prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def similar_get(fp: Fingerprint, model_name: str, prompt: str) -> Optional[Dict[str, Any]]:
+    """Closest cached result of the same size within the Hamming threshold, or None."""
+    max_dist = min(LLM_CACHE_CONFIG.phash_max_distance, _MAX_DISTANCE)
+    if not enabled() or max_dist < 0:
+        return None
+
+    phash, width, height = fp
+    best: Optional[tuple[int, str]] = None
+    try:
+        with _db_lock:
+            rows = _connection().execute(
+                "SELECT phash, created, payload FROM phash_entries"
+                " WHERE model = ? AND prompt = ? AND width = ? AND height = ?"
+                " AND (b0 = ? OR b1 = ? OR b2 = ? OR b3 = ?)",
+                (model_name, _prompt_key(prompt), width, height, *_bands(phash)),
+            ).fetchall()
+    except (sqlite3.Error, OSError):
+        return None
+
+    for stored, created, payload in rows:
+        if _expired(created):
+            continue
+        dist = bin((stored % _U64) ^ phash).count("1")  # stored signed; see similar_set
+        if dist <= max_dist and (best is None or dist < best[0]):
+            best = (dist, payload)
+            if dist == 0:
+                break
+
+    if best is None:
+        return None
+    try:
+        value = json.loads(best[1])
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def similar_set(fp: Fingerprint, model_name: str, prompt: str, value: Dict[str, Any]) -> None:
+    if not enabled() or LLM_CACHE_CONFIG.phash_max_distance < 0:
+        return
+    phash, width, height = fp
+    signed = phash - _U64 if phash >= (1 << 63) else phash  # SQLite INTEGER is signed 64-bit
+    try:
+        with _db_lock:
+            conn = _connection()
+            with conn:
+                conn.execute(
+                    "INSERT INTO phash_entries"
+                    " (phash, b0, b1, b2, b3, width, height, model, prompt, created, payload)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (signed, *_bands(phash), width, height, model_name, _prompt_key(prompt),
+                     time.time(), json.dumps(value, ensure_ascii=False)),
+                )
+    except (sqlite3.Error, OSError):
+        pass
@@ -1,12 +1,27 @@
+import functools
+import itertools
 import json
 import os
 import re
-import tempfile
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import cv2
+import numpy as np
 from agents.image_agent import ImageAgent
 
+try:
+    import orjson  # faster parse of the few-KB grid responses
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_FALSY = frozenset(("false", "0", "no", "n", "off", "irrelevant", "unrelated"))
+_TRUTHY = frozenset(("true", "1", "yes", "y", "on", "relevant", "related"))
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
 
 class GridScoringAgent(ImageAgent):
     """
@@ -27,9 +42,25 @@ class GridScoringAgent(ImageAgent):
         - matrix: 6x6 list (rows 1..6, cols A..F)
     """
 
+    __slots__ = ()  # all state lives on ImageAgent's slots
+
     ROWS = 6
     COLS = 6
     COL_LABELS = ["A", "B", "C", "D", "E", "F"]
+    # "A1".."F1", "A2".., row-major like the drawing loop
+    LABELS = tuple(f"{c}{r}" for r, c in itertools.product(range(1, ROWS + 1), COL_LABELS))
+    VALID_CELL_KEYS: ClassVar[FrozenSet[str]] = frozenset(LABELS)
+    # Longest side of the gridded image sent to the model
+    MAX_UPLOAD_DIM = 768
+    # Plenty for grid lines/labels the model has to read; ~2x smaller than q95
+    UPLOAD_JPEG_QUALITY = 75
+    # ImageAgent reports failures as text instead of raising; these turn them back into errors
+    _ERROR_PREFIXES = ("Error:", "An error occurred:")
+    # Grid drawing/encoding runs here while the caller builds the prompt
+    # (OpenCV releases the GIL for resize/putText/imencode)
+    _draw_executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="grid-draw"
+    )
 
     def __init__(
         self,
@@ -59,73 +90,132 @@ class GridScoringAgent(ImageAgent):
 
     # --------------------------- Grid drawing ---------------------------
 
-    def _draw_grid_with_labels(self, image_path: str) -> str:
-        """Loads image, draws 6x6 grid + centered labels (A1..F6), saves to a temp file."""
-        img = cv2.imread(image_path)
-        if img is None:
-            raise FileNotFoundError(f"Could not load image at {image_path}")
-
-        h, w, _ = img.shape
-        dy, dx = h / self.ROWS, w / self.COLS
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _grid_overlay(cls, h: int, w: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(BGR overlay, bool mask of the pixels it covers) for an h x w image.
 
+        Rasterized once per size; the arrays are shared between threads, so read-only.
+        """
         # Grid visual styling
         grid_color = (0, 255, 0)  # neon green
         thickness = max(1, int(min(h, w) * 0.003))
 
+        dy, dx = h / cls.ROWS, w / cls.COLS
+        overlay = np.zeros((h, w, 3), dtype=np.uint8)
+        # Separate mask: the black label outline is indistinguishable from empty overlay pixels
+        mask = np.zeros((h, w), dtype=np.uint8)
+
+        # Lines are axis-aligned bands, so fill them with direct slice stores
+        # (the color tuple broadcasts over the BGR channels) instead of cv2.line.
+        half = thickness // 2
+
         # Draw vertical lines
-        for x in range(1, self.COLS):
-            x_pos = int(round(x * dx))
-            cv2.line(img, (x_pos, 0), (x_pos, h), grid_color, thickness)
+        for x in range(1, cls.COLS):
+            x0 = max(0, int(round(x * dx)) - half)
+            overlay[:, x0 : min(w, x0 + thickness)] = grid_color
+            mask[:, x0 : min(w, x0 + thickness)] = 255
 
         # Draw horizontal lines
-        for y in range(1, self.ROWS):
-            y_pos = int(round(y * dy))
-            cv2.line(img, (0, y_pos), (w, y_pos), grid_color, thickness)
+        for y in range(1, cls.ROWS):
+            y0 = max(0, int(round(y * dy)) - half)
+            overlay[y0 : min(h, y0 + thickness), :] = grid_color
+            mask[y0 : min(h, y0 + thickness), :] = 255
 
         # Draw Labels
         font = cv2.FONT_HERSHEY_SIMPLEX
+        font_scale, font_thickness, layout = cls._label_layout(h, w)
+
+        for label, text_x, text_y in layout:
+            # black outline for readability (the outline covers the label, so it bounds the mask)
+            cv2.putText(
+                overlay,
+                label,
+                (text_x, text_y),
+                font,
+                font_scale,
+                (0, 0, 0),
+                font_thickness + 2,
+                cv2.LINE_AA,
+            )
+            cv2.putText(
+                mask,
+                label,
+                (text_x, text_y),
+                font,
+                font_scale,
+                255,
+                font_thickness + 2,
+                cv2.LINE_AA,
+            )
+            # magenta label
+            cv2.putText(
+                overlay,
+                label,
+                (text_x, text_y),
+                font,
+                font_scale,
+                (255, 0, 255),
+                font_thickness,
+                cv2.LINE_AA,
+            )
+
+        mask = mask.astype(bool)
+        overlay.setflags(write=False)
+        mask.setflags(write=False)
+        return overlay, mask
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _label_layout(cls, h: int, w: int) -> Tuple[float, int, Tuple[Tuple[str, int, int], ...]]:
+        """(font_scale, font_thickness, ((label, text_x, text_y), ...)) centering LABELS in each cell."""
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        dy, dx = h / cls.ROWS, w / cls.COLS
         font_scale = min(dx, dy) * 0.012
         font_thickness = max(1, int(font_scale * 2))
 
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                label = f"{self.COL_LABELS[c]}{r + 1}"
-
-                text_size = cv2.getTextSize(label, font, font_scale, font_thickness)[0]
-                cell_x_start = int(c * dx)
-                cell_y_start = int(r * dy)
-                text_x = cell_x_start + int((dx - text_size[0]) / 2)
-                text_y = cell_y_start + int((dy + text_size[1]) / 2)
-
-                # black outline for readability
-                cv2.putText(
-                    img,
-                    label,
-                    (text_x, text_y),
-                    font,
-                    font_scale,
-                    (0, 0, 0),
-                    font_thickness + 2,
-                    cv2.LINE_AA,
-                )
-                # magenta label
-                cv2.putText(
-                    img,
-                    label,
-                    (text_x, text_y),
-                    font,
-                    font_scale,
-                    (255, 0, 255),
-                    font_thickness,
-                    cv2.LINE_AA,
-                )
-
-        fd, temp_path = tempfile.mkstemp(suffix=".jpg")
-        os.close(fd)
-        ok = cv2.imwrite(temp_path, img)
+        layout = []
+        for i, label in enumerate(cls.LABELS):
+            r, c = divmod(i, cls.COLS)
+            text_size = cv2.getTextSize(label, font, font_scale, font_thickness)[0]
+            text_x = int(c * dx) + int((dx - text_size[0]) / 2)
+            text_y = int(r * dy) + int((dy + text_size[1]) / 2)
+            layout.append((label, text_x, text_y))
+        return font_scale, font_thickness, tuple(layout)
+
+    def _grid_jpeg(self, image_path: str) -> bytes:
+        """Gridded upload for `image_path`, drawn once per file version and reused by the
+        batched call and any per-factor retries of the same analysis."""
+        st = os.stat(image_path)
+        return self._cached_grid_jpeg(image_path, st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4)
+    def _cached_grid_jpeg(cls, image_path: str, _mtime_ns: int, _size: int) -> bytes:
+        # mtime/size only key the cache, so an edited file is redrawn
+        return cls._draw_grid_with_labels(image_path)
+
+    @classmethod
+    def _draw_grid_with_labels(cls, image_path: str) -> bytes:
+        """Loads image, draws 6x6 grid + centered labels (A1..F6), returns it JPEG-encoded."""
+        img = cv2.imread(image_path)
+        if img is None:
+            raise FileNotFoundError(f"Could not load image at {image_path}")
+
+        # 6x6 cells need far less than a full camera frame; smaller upload, fewer vision tokens
+        h, w, _ = img.shape
+        scale = cls.MAX_UPLOAD_DIM / max(h, w)
+        if scale < 1.0:
+            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            h, w, _ = img.shape
+
+        overlay, mask = cls._grid_overlay(h, w)
+        img[mask] = overlay[mask]
+
+        ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, cls.UPLOAD_JPEG_QUALITY])
         if not ok:
-            raise RuntimeError("Failed to write temporary grid image.")
-        return temp_path
+            raise RuntimeError("Failed to encode grid image.")
+        return buf.tobytes()
 
     # --------------------------- Public API ---------------------------
 
@@ -134,15 +224,16 @@ class GridScoringAgent(ImageAgent):
         image_path: str,
         factor: Dict[str, str],
         custom_prompt: Optional[str] = None,
-        return_format: str = "both",  # "matrix" | "map" | "both"
-    ) -> Union[List[List[int]], Dict[str, int], Dict[str, Any]]:
+        return_format: str = "both",  # "matrix" | "ndarray" | "map" | "both"
+    ) -> Union[List[List[int]], np.ndarray, Dict[str, int], Dict[str, Any]]:
         """
         Overlays grid, queries LLM, parses/validates output, and returns:
           - "matrix": 6x6 list of ints (rows 1..6, cols A..F)
+          - "ndarray": the same intensities as a (6, 6) uint8 numpy array
           - "map": {"A1": int, ..., "F6": int}
           - "both": {"grid_map": {...}, "grid_matrix": [[...],[...],...]}
         """
-        temp_img_path = self._draw_grid_with_labels(image_path)
+        draw_future = self._draw_executor.submit(self._grid_jpeg, image_path)
 
         factor_title = factor.get("title", "Unknown Factor")
         factor_desc = factor.get("description", "No description provided.")
@@ -161,67 +252,109 @@ class GridScoringAgent(ImageAgent):
 
         final_prompt = custom_prompt or task_prompt
 
-        try:
-            text = self.analyze_image(temp_img_path, custom_prompt=final_prompt)
-
-            if isinstance(text, str) and text.startswith("Error:"):
-                raise RuntimeError(text)
-
-            raw_obj = self._safe_json_parse(text)
-            grid_map_raw = self._extract_grid_map(raw_obj)
-            grid_map = self._validate_and_fill_grid(grid_map_raw)
-            intensity_matrix = self._map_to_intensity_matrix(grid_map)
-            relevance_matrix = self._map_to_relevance_matrix(grid_map)
-
-            if return_format == "matrix":
-                return intensity_matrix
-            if return_format == "map":
-                return grid_map
-            return {
-                "grid_map": grid_map,
-                "grid_intensity_matrix": intensity_matrix,
-                "grid_relevance_matrix": relevance_matrix,
-            }
-
-        finally:
-            if os.path.exists(temp_img_path):
-                os.remove(temp_img_path)
+        grid_jpeg = draw_future.result()
+        text = self.analyze_image_bytes(grid_jpeg, custom_prompt=final_prompt, cache_if=self._has_grid_map)
 
-    # --------------------------- Conversions ---------------------------
+        if isinstance(text, str) and text.startswith(self._ERROR_PREFIXES):
+            raise RuntimeError(text)
 
-    @classmethod
-    def _map_to_intensity_matrix(cls, grid_map: Dict[str, Any]) -> List[List[int]]:
+        raw_obj = self._safe_json_parse(text)
+        grid_map_raw = self._extract_grid_map(raw_obj)
+        return self._format_result(grid_map_raw, return_format)
+
+    def score_grid_multi(
+        self,
+        image_path: str,
+        factors: List[Dict[str, str]],
+        return_format: str = "both",  # "matrix" | "ndarray" | "map" | "both"
+    ) -> List[Optional[Union[List[List[int]], np.ndarray, Dict[str, int], Dict[str, Any]]]]:
         """
-        Convert {"A1": {"intensity":..,"relevant":..}, ...} -> 6x6 matrix of intensity ints.
-          - row 0 is row 1 (A1..F1)
-          - row 5 is row 6 (A6..F6)
+        Scores several factors with ONE grid draw and ONE LLM call.
+
+        Returns one result per factor (same shapes as `score_grid`), in order. A factor the
+        response did not cover is None, so callers can retry just that one with `score_grid`.
         """
-        matrix: List[List[int]] = []
-        for r in range(1, cls.ROWS + 1):
-            row_vals: List[int] = []
-            for c in cls.COL_LABELS:
-                cell = f"{c}{r}"
-                payload = grid_map.get(cell, {})
-                intensity, _rel = cls._coerce_cell_payload(payload)
-                row_vals.append(intensity)
-            matrix.append(row_vals)
-        return matrix
+        if not factors:
+            return []
+
+        draw_future = self._draw_executor.submit(self._grid_jpeg, image_path)
+
+        factor_lines = []
+        for i, factor in enumerate(factors, start=1):
+            factor_lines.append(
+                f"factor_{i}:\n"
+                f"TITLE: {factor.get('title', 'Unknown Factor')}\n"
+                f"DESCRIPTION: {factor.get('description', 'No description provided.')}\n"
+            )
+        task_prompt = (
+            f"Analyze the attached image separately for each of these {len(factors)} Interest Factors:\n\n"
+            + "\n".join(factor_lines)
+            + "\nLook at the visual 6x6 grid overlaid on the image. For EVERY factor and EVERY cell (A1 through F6), output:\n"
+            "- intensity: integer 0..100 (how strong the factor is in that cell)\n"
+            "- relevant: boolean (true if the cell is part of the meaningful region for the factor; false if it is outside/irrelevant)\n\n"
+            "Important: If a cell is ocean/outside borders/blank background/etc. and does not meaningfully belong to the subject region, set relevant=false.\n"
+            "Return ONLY valid JSON, no markdown and no commentary.\n"
+            'Use schema: {"factor_1": {"A1": {"intensity": 0, "relevant": true}, ..., "F6": {"intensity": 0, "relevant": true}}, '
+            '"factor_2": {...}, ...} with one key per factor listed above.'
+        )
+
+        grid_jpeg = draw_future.result()
+        count = len(factors)
+        text = self.analyze_image_bytes(
+            grid_jpeg,
+            custom_prompt=task_prompt,
+            # a partial answer is used once, but not pinned in the cache
+            cache_if=lambda t: all(self._extract_multi_grid_maps(self._safe_json_parse(t), count)),
+        )
+
+        if isinstance(text, str) and text.startswith(self._ERROR_PREFIXES):
+            raise RuntimeError(text)
+
+        raw_maps = self._extract_multi_grid_maps(self._safe_json_parse(text), count)
+        return [
+            self._format_result(raw, return_format) if raw else None
+            for raw in raw_maps
+        ]
+
+    def _format_result(
+        self, grid_map_raw: Dict[str, Any], return_format: str
+    ) -> Union[List[List[int]], np.ndarray, Dict[str, int], Dict[str, Any]]:
+        grid_map = self._validate_and_fill_grid(grid_map_raw)
+        intensity_matrix, relevance_matrix = self._map_to_matrices(grid_map)
+
+        if return_format == "matrix":
+            return intensity_matrix
+        if return_format == "ndarray":
+            # compact, vectorizable form for downstream thresholding/interpolation
+            return np.array(intensity_matrix, dtype=np.uint8)
+        if return_format == "map":
+            return grid_map
+        return {
+            "grid_map": grid_map,
+            "grid_intensity_matrix": intensity_matrix,
+            "grid_relevance_matrix": relevance_matrix,
+        }
+
+    # --------------------------- Conversions ---------------------------
 
     @classmethod
-    def _map_to_relevance_matrix(cls, grid_map: Dict[str, Any]) -> List[List[bool]]:
+    def _map_to_matrices(cls, grid_map: Dict[str, Dict[str, Any]]) -> Tuple[List[List[int]], List[List[bool]]]:
         """
-        Convert {"A1": {"intensity":..,"relevant":..}, ...} -> 6x6 matrix of relevance booleans.
+        Convert the cleaned map from `_validate_and_fill_grid` ({"A1": {"intensity": int,
+        "relevant": bool}, ... all 36 cells}) -> (intensity, relevance) 6x6 matrices.
+        Values are already coerced there, so they are read as-is.
+          - row 0 is row 1 (A1..F1)
+          - row 5 is row 6 (A6..F6)
         """
-        matrix: List[List[bool]] = []
-        for r in range(1, cls.ROWS + 1):
-            row_vals: List[bool] = []
-            for c in cls.COL_LABELS:
-                cell = f"{c}{r}"
-                payload = grid_map.get(cell, {})
-                _intensity, rel = cls._coerce_cell_payload(payload)
-                row_vals.append(bool(rel))
-            matrix.append(row_vals)
-        return matrix
+        cells = [grid_map[key] for key in cls.LABELS]  # row-major, A1..F6
+        cols = cls.COLS
+        intensity_matrix: List[List[int]] = []
+        relevance_matrix: List[List[bool]] = []
+        for start in range(0, len(cells), cols):
+            row = cells[start : start + cols]
+            intensity_matrix.append([cell["intensity"] for cell in row])
+            relevance_matrix.append([cell["relevant"] for cell in row])
+        return intensity_matrix, relevance_matrix
 
 
     # --------------------------- Parsing + Validation ---------------------------
@@ -229,7 +362,7 @@ class GridScoringAgent(ImageAgent):
     @staticmethod
     def _strip_code_fences(s: str) -> str:
         s = s.strip()
-        fence_match = re.search(r"```(?:json)?\s*(.*?)\s*```", s, flags=re.DOTALL | re.IGNORECASE)
+        fence_match = _FENCE_RE.search(s)
         if fence_match:
             return fence_match.group(1).strip()
         return s
@@ -244,24 +377,54 @@ class GridScoringAgent(ImageAgent):
 
         # Attempt direct json parse
         try:
-            obj = json.loads(cleaned)
+            obj = _json_loads(cleaned)
             return obj if isinstance(obj, dict) else {}
         except Exception:
             pass
 
-        # Fallback: extract the outermost {...} region and parse it
-        start = cleaned.find("{")
-        end = cleaned.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            candidate = cleaned[start : end + 1]
+        # Fallback: extract the first balanced {...} object and parse it
+        candidate = cls._extract_first_json_object(cleaned)
+        if candidate is not None:
             try:
-                obj = json.loads(candidate)
+                obj = _json_loads(candidate)
                 return obj if isinstance(obj, dict) else {}
             except Exception:
                 return {}
 
         return {}
 
+    @staticmethod
+    def _extract_first_json_object(s: str) -> Optional[str]:
+        """
+        Single left-to-right scan for the first balanced {...} region, ignoring braces
+        inside JSON strings. Stray braces in trailing commentary do not affect it.
+        """
+        start = s.find("{")
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(s)):
+            ch = s[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    return s[start : i + 1]
+        return None
+
     @classmethod
     def _extract_grid_map(cls, obj: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -277,8 +440,8 @@ class GridScoringAgent(ImageAgent):
         if isinstance(gv, dict):
             return gv
 
-        valid_keys = cls._valid_cell_keys_set()
-        hits = sum(1 for k in obj.keys() if isinstance(k, str) and k.strip().upper() in valid_keys)
+        normalized_keys = {k.strip().upper() for k in obj if isinstance(k, str)}
+        hits = len(normalized_keys & cls.VALID_CELL_KEYS)
         if hits >= 6:  # heuristic threshold
             return obj
 
@@ -290,12 +453,34 @@ class GridScoringAgent(ImageAgent):
         return {}
 
     @classmethod
-    def _valid_cell_keys_set(cls) -> set:
-        return {f"{c}{r}" for r in range(1, cls.ROWS + 1) for c in cls.COL_LABELS}
+    def _has_grid_map(cls, text: str) -> bool:
+        """True if `text` parses to a non-empty cell map (only such responses are cached)."""
+        return bool(cls._extract_grid_map(cls._safe_json_parse(text)))
+
+    @classmethod
+    def _extract_multi_grid_maps(cls, obj: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+        """
+        Split {"factor_1": {...}, "factor_2": {...}, ...} into `count` raw cell maps
+        (each accepted in any shape `_extract_grid_map` understands; missing -> {}).
+        """
+        if not isinstance(obj, dict):
+            return [{} for _ in range(count)]
+
+        # Tolerate a wrapper object and key case/spacing drift ("Factor_1", " factor_1 ")
+        for wrapper in ("factors", "results"):
+            if isinstance(obj.get(wrapper), dict):
+                obj = obj[wrapper]
+                break
+        by_key = {k.strip().lower(): v for k, v in obj.items() if isinstance(k, str)}
+
+        return [cls._extract_grid_map(by_key.get(f"factor_{i}")) for i in range(1, count + 1)]
 
     @classmethod
     def _coerce_score(cls, v: Any) -> int:
         """Coerce value into an int in [0, 100]. Handles ints/floats/numeric strings and messy strings."""
+        # Fast path: the model almost always returns a plain in-range int (bool excluded)
+        if type(v) is int and 0 <= v <= 100:
+            return v
         if v is None:
             return 0
 
@@ -304,7 +489,7 @@ class GridScoringAgent(ImageAgent):
 
         if isinstance(v, str):
             s = v.strip()
-            m = re.search(r"-?\d+(\.\d+)?", s)
+            m = _NUM_RE.search(s)
             if not m:
                 return 0
             try:
@@ -318,17 +503,17 @@ class GridScoringAgent(ImageAgent):
     @classmethod
     def _coerce_relevant(cls, v: Any) -> bool:
         """Coerce value into a boolean. Defaults to True when unknown."""
+        if v is True or v is False:  # by far the most common model output
+            return v
         if v is None:
             return True
-        if isinstance(v, bool):
-            return v
         if isinstance(v, (int, float)):
             return bool(v)
         if isinstance(v, str):
             s = v.strip().lower()
-            if s in ("false", "0", "no", "n", "off", "irrelevant", "unrelated"):
+            if s in _FALSY:
                 return False
-            if s in ("true", "1", "yes", "y", "on", "relevant", "related"):
+            if s in _TRUTHY:
                 return True
         return True
 
@@ -366,7 +551,7 @@ class GridScoringAgent(ImageAgent):
         Missing/invalid -> intensity=0, relevant=True.
         """
         cleaned: Dict[str, Dict[str, Any]] = {}
-        valid_keys = cls._valid_cell_keys_set()
+        valid_keys = cls.VALID_CELL_KEYS
 
         normalized: Dict[str, Any] = {}
         if isinstance(grid_values, dict):
@@ -377,11 +562,10 @@ class GridScoringAgent(ImageAgent):
                 if kk in valid_keys:
                     normalized[kk] = v
 
-        for r in range(1, cls.ROWS + 1):
-            for c in cls.COL_LABELS:
-                key = f"{c}{r}"
-                intensity, relevant = cls._coerce_cell_payload(normalized.get(key, {}))
-                cleaned[key] = {"intensity": intensity, "relevant": bool(relevant)}
+        # Each payload is coerced exactly once here; _map_to_matrices reads the result as-is
+        for key in cls.LABELS:
+            intensity, relevant = cls._coerce_cell_payload(normalized.get(key, {}))
+            cleaned[key] = {"intensity": intensity, "relevant": relevant}
 
         return cleaned
 
@@ -1,42 +1,80 @@
+import mimetypes
 import os
-from PIL import Image
+import threading
+from typing import Callable, Optional
 from dotenv import load_dotenv
 from google import genai
+from google.genai import types
+
+from agents import _llm_cache
+
+# One .env parse and one genai.Client (with its connection pool) per process, shared by all agents
+_ENV_LOADED = False
+_CLIENT: Optional[genai.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> genai.Client:
+    global _ENV_LOADED, _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            if not _ENV_LOADED:
+                # Load environment variables from .env file
+                load_dotenv()
+                _ENV_LOADED = True
+
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                raise ValueError("GOOGLE_API_KEY not found in environment variables.")
+
+            _CLIENT = genai.Client(api_key=api_key)
+        return _CLIENT
 
 class ImageAgent:
+    # Fixed attribute set; no per-instance __dict__ on the Pi
+    __slots__ = ("client", "model_name", "default_prompt")
+
     def __init__(self, model_name="gemini-2.5-flash-lite", default_prompt="Can you explain what is happening in this image?"):
         """
         Initializes the ImageAgent with API keys, model selection, and a base prompt.
         """
-        # Load environment variables from .env file
-        load_dotenv()
-        
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not found in environment variables.")
-
-        # Initialize the GenAI client
-        self.client = genai.Client(api_key=api_key)
+        # Shared GenAI client (created on first use)
+        self.client = _get_client()
         self.model_name = model_name
         self.default_prompt = default_prompt
 
-    def analyze_image(self, image_path, custom_prompt=None):
+    def analyze_image(self, image_path, custom_prompt=None, cache_if: Optional[Callable[[str], bool]] = None):
         """
         Loads an image from a file path and sends it to Gemini for analysis.
+
+        A fresh response is cached only if `cache_if(text)` is true (default: always),
+        so callers can keep answers they cannot parse out of the cache.
         """
         try:
-            # Load the local image using PIL
-            image = Image.open(image_path)
-            
+            # Read the file once: the bytes key the response cache and go to Gemini as-is
+            with open(image_path, "rb") as f:
+                data = f.read()
+
             # Use custom prompt if provided, otherwise use the constructor's default
             prompt = custom_prompt if custom_prompt else self.default_prompt
 
+            key = _llm_cache.make_key(self.model_name, prompt, data)
+            cached = _llm_cache.get(key)
+            if cached is not None:
+                return cached
+
+            # Inline the encoded file instead of decoding it with PIL first
+            mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
+            image = types.Part.from_bytes(data=data, mime_type=mime_type)
+
             # Generate content
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=[prompt, image]
             )
 
+            if cache_if is None or cache_if(response.text):
+                _llm_cache.set(key, response.text)
             return response.text
 
         except FileNotFoundError:
@@ -44,6 +82,33 @@ class ImageAgent:
         except Exception as e:
             return f"An error occurred: {str(e)}"
 
+    def analyze_image_bytes(
+        self, data, mime_type="image/jpeg", custom_prompt=None, cache_if: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Sends already-encoded image bytes to Gemini as inline data (no file, no PIL decode).
+        `cache_if` works as in `analyze_image`.
+        """
+        try:
+            prompt = custom_prompt if custom_prompt else self.default_prompt
+
+            key = _llm_cache.make_key(self.model_name, prompt, data)
+            cached = _llm_cache.get(key)
+            if cached is not None:
+                return cached
+
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=[prompt, types.Part.from_bytes(data=data, mime_type=mime_type)]
+            )
+
+            if cache_if is None or cache_if(response.text):
+                _llm_cache.set(key, response.text)
+            return response.text
+
+        except Exception as e:
+            return f"An error occurred: {str(e)}"
+
 # --- Usage Example ---
 if __name__ == "__main__":
     # Example initialization
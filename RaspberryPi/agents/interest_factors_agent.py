@@ -1,8 +1,12 @@
 import json
+import re
 from typing import Any, Dict, List, Optional
 
+from agents import _llm_cache
 from agents.image_agent import ImageAgent
 
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.M)
+
 class InterestFactorsAgent(ImageAgent):
     """
     An agent specialized to extract 'interest factors' and image context 
@@ -13,6 +17,8 @@ class InterestFactorsAgent(ImageAgent):
     - Uses an advanced prompt with strict rules and few-shot examples.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         model_name: str = "gemini-2.5-flash-lite",
@@ -89,8 +95,26 @@ class InterestFactorsAgent(ImageAgent):
                 "image_context": "...",
                 "interest_factors": [{"title": "...", "description": "..."}, ...]
             }
+
+        Near-duplicate images (same model/prompt/size, dHash within the configured distance)
+        reuse a previously parsed result without calling the model.
         """
-        text = self.analyze_image(image_path, custom_prompt=custom_prompt)
+        prompt = custom_prompt if custom_prompt else self.default_prompt
+        try:
+            fp: Optional[_llm_cache.Fingerprint] = _llm_cache.fingerprint(image_path)
+        except Exception:
+            fp = None  # unreadable here -> let analyze_image report it
+        if fp is not None:
+            cached = _llm_cache.similar_get(fp, self.model_name, prompt)
+            if cached is not None:
+                return cached
+
+        # Only answers that parse to factors are cached; a bad one is retried next time
+        text = self.analyze_image(
+            image_path,
+            custom_prompt=custom_prompt,
+            cache_if=lambda t: bool(self._safe_json_parse(t).get("interest_factors")),
+        )
     
 
         if isinstance(text, str) and text.startswith("Error:"):
@@ -118,32 +142,37 @@ class InterestFactorsAgent(ImageAgent):
                 })
 
         # Hard cap at 6 factors
-        return {
+        result = {
             "image_context": str(context).strip(),
             "interest_factors": cleaned_factors[:6]
         }
+        if fp is not None and cleaned_factors:  # never cache an empty/failed parse
+            _llm_cache.similar_set(fp, self.model_name, prompt, result)
+        return result
 
     @staticmethod
     def _safe_json_parse(text: str) -> Dict[str, Any]:
         if not isinstance(text, str):
             return {"image_context": "Parse Error", "interest_factors": []}
 
+        s = text.strip()
+        if "```" in s:
+            s = _FENCE_RE.sub("", s).strip()
+
+        # One parse: the whole string when it is already a bare object, otherwise only the
+        # outermost {...} span (parsing the wrapped text first could only fail)
+        if not (s.startswith("{") and s.endswith("}")):
+            start = s.find("{")
+            end = s.rfind("}")
+            if start == -1 or end == -1 or end <= start:
+                return {"image_context": "Parse Error", "interest_factors": []}
+            s = s[start : end + 1]
+
         try:
-            obj = json.loads(text)
+            obj = json.loads(s)
             if isinstance(obj, dict):
                 return obj
         except Exception:
             pass
 
-        start = text.find("{")
-        end = text.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            candidate = text[start : end + 1]
-            try:
-                obj = json.loads(candidate)
-                if isinstance(obj, dict):
-                    return obj
-            except Exception:
-                pass
-
         return {"image_context": "Parse Error", "interest_factors": []}
\ No newline at end of file
@@ -18,9 +18,6 @@ class MouseConfig:
     start_x: int = max_x // 2
     start_y: int = max_y // 2
 
-    # Startup averaging
-    startup_samples: int = 10
-
     # Optional scale if you want to speed up / slow down integrated movement
     scale_x: float = 1.0
     scale_y: float = 1.0
@@ -96,3 +93,25 @@ class ImageProcessingConfig:
 
 
 IMAGE_CONFIG = ImageProcessingConfig()
+
+
+@dataclass(frozen=True)
+class LLMCacheConfig:
+    """
+    Exact-match cache for Gemini responses (agents/_llm_cache.py).
+
+    - enabled: set False (or env LLM_CACHE=0) to always call the model
+    - ttl_s: entries older than this are ignored; 0 = never expire
+    - memory_entries: size of the in-process LRU in front of the disk files
+    - subdir: folder under ImageProcessingConfig.cache_dir holding one JSON file per key
+    - phash_max_distance: max differing dHash bits (of 64, capped at 3) for a near-duplicate
+      hit on an image of the same size; -1 = exact-match tier only
+    """
+    enabled: bool = True
+    ttl_s: float = 7 * 24 * 3600.0
+    memory_entries: int = 128
+    subdir: str = "llm"
+    phash_max_distance: int = 3
+
+
+LLM_CACHE_CONFIG = LLMCacheConfig()
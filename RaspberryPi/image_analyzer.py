@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from agents.interest_factors_agent import InterestFactorsAgent
@@ -12,10 +13,18 @@ class ImageAnalyzer:
     Pipeline:
       1) InterestFactorsAgent.get_interest_factors(image_path) -> dict:
             {"image_context": str, "interest_factors": [ {"title":..,"description":..}, ... ]}
-      2) For each factor -> GridScoringAgent.score_grid(image_path, factor)
+      2) All factors -> GridScoringAgent.score_grid_multi(image_path, factors) (one LLM call);
+         any factor it misses -> GridScoringAgent.score_grid(image_path, factor)
+         (those calls are independent network requests and run in parallel, retried on 429)
       3) Return structured result
     """
 
+    # Parallel per-factor fallback calls; matches the 6-factor cap of InterestFactorsAgent
+    MAX_PARALLEL_SCORING = 6
+    # Rate-limit (HTTP 429) retries per factor, with exponential backoff from this delay
+    RATE_LIMIT_RETRIES = 3
+    RATE_LIMIT_BACKOFF_S = 1.0
+
     def __init__(
         self,
         interest_agent: Optional[InterestFactorsAgent] = None,
@@ -63,10 +72,48 @@ class ImageAnalyzer:
             out["meta"]["duration_sec"] = round(time.time() - started, 4)
             return out
 
-        # 2) Score each factor
-        for idx, factor in enumerate(factors):
-            factor_obj: Dict[str, Any] = factor if isinstance(factor, dict) else {"raw": factor}
+        # 2) Score all factors in one batched call, then each factor on its own if missed
+        factor_objs: List[Dict[str, Any]] = [
+            factor if isinstance(factor, dict) else {"raw": factor} for factor in factors
+        ]
+        try:
+            batched = self.grid_agent.score_grid_multi(image_path, factor_objs)
+        except Exception:
+            batched = [None] * len(factor_objs)
+
+        pending = [
+            idx for idx in range(len(factor_objs))
+            if idx >= len(batched) or batched[idx] is None
+        ]
+        executor: Optional[ThreadPoolExecutor] = None
+        futures: Dict[int, Future] = {}
+        if pending:
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(pending), self.MAX_PARALLEL_SCORING),
+                thread_name_prefix="grid-score",
+            )
+            futures = {
+                idx: executor.submit(self._score_with_retry, image_path, factor_objs[idx])
+                for idx in pending
+            }
+
+        try:
+            return self._collect_entries(out, factor_objs, batched, futures, started)
+        finally:
+            if executor is not None:
+                # early return (continue_on_error=False) drops the not-yet-started calls
+                executor.shutdown(wait=False, cancel_futures=True)
 
+    def _collect_entries(
+        self,
+        out: Dict[str, Any],
+        factor_objs: List[Dict[str, Any]],
+        batched: List[Any],
+        futures: Dict[int, Future],
+        started: float,
+    ) -> Dict[str, Any]:
+        """Build the per-factor entries in order, waiting on each fallback call as needed."""
+        for idx, factor_obj in enumerate(factor_objs):
             entry: Dict[str, Any] = {
                 "index": idx,
                 "factor": {
@@ -79,7 +126,8 @@ class ImageAnalyzer:
             }
 
             try:
-                entry["grid_scoring"] = self.grid_agent.score_grid(image_path, factor_obj)
+                fut = futures.get(idx)
+                entry["grid_scoring"] = fut.result() if fut is not None else batched[idx]
             except Exception as e:
                 entry["error"] = f"GridScoringAgent failed: {e}"
                 if not self.continue_on_error:
@@ -94,6 +142,20 @@ class ImageAnalyzer:
         out["meta"]["duration_sec"] = round(time.time() - started, 4)
         return out
 
+    def _score_with_retry(self, image_path: str, factor_obj: Dict[str, Any]) -> Any:
+        """score_grid, retried with exponential backoff while the API reports rate limiting."""
+        delay = self.RATE_LIMIT_BACKOFF_S
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            try:
+                return self.grid_agent.score_grid(image_path, factor_obj)
+            except Exception as e:
+                msg = str(e)
+                rate_limited = "429" in msg or "RESOURCE_EXHAUSTED" in msg
+                if not rate_limited or attempt == self.RATE_LIMIT_RETRIES:
+                    raise
+            time.sleep(delay)
+            delay *= 2
+
 
 if __name__ == "__main__":
     import json
@@ -30,19 +30,6 @@ class MouseInput:
         # Internal device handle
         self._dev: Optional[InputDevice] = None
 
-        # Simple startup stabilization (kept intentionally minimal)
-        self._apply_startup_average()
-
-    def _apply_startup_average(self) -> None:
-        n = int(self.cfg.startup_samples)
-        if n <= 0:
-            return
-        # Average of same value is the same value; this is a minimal “stabilize start” step.
-        # (Avoids adding extra calibration complexity.)
-        with self._lock:
-            self._x = int(round(sum([self.cfg.start_x] * n) / n))
-            self._y = int(round(sum([self.cfg.start_y] * n) / n))
-
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
@@ -66,38 +53,46 @@ class MouseInput:
         return x, y
 
     def _run(self) -> None:
-        while not self._stop_event.is_set():
+        # Hot loop (one pass per mouse event): everything it reads is bound to locals once
+        cfg = self.cfg
+        sx, sy = cfg.scale_x, cfg.scale_y
+        unit_scale = sx == 1.0 and sy == 1.0  # default: integer-only path, no multiply/round
+        min_x, max_x, min_y, max_y = cfg.min_x, cfg.max_x, cfg.min_y, cfg.max_y
+        ev_rel, rel_x, rel_y = ecodes.EV_REL, ecodes.REL_X, ecodes.REL_Y
+        lock = self._lock
+        stop_event = self._stop_event
+
+        while not stop_event.is_set():
             try:
                 if self._dev is None:
                     self._dev = self._open_device()
 
                 # Blocking event loop
                 for event in self._dev.read_loop():
-                    if self._stop_event.is_set():
+                    if stop_event.is_set():
                         break
 
-                    if event.type != ecodes.EV_REL:
-                        continue
-
-                    dx = 0
-                    dy = 0
-
-                    if event.code == ecodes.REL_X:
-                        dx = event.value
-                    elif event.code == ecodes.REL_Y:
-                        dy = event.value
-                    else:
+                    if event.type != ev_rel:
                         continue
 
-                    if dx == 0 and dy == 0:
+                    value = event.value
+                    if value == 0:
                         continue
 
-                    # Integrate into absolute coords
-                    with self._lock:
-                        new_x = self._x + int(round(dx * self.cfg.scale_x))
-                        new_y = self._y + int(round(dy * self.cfg.scale_y))
-                        self._x, self._y = self._clamp(new_x, new_y)
-                        self._moved = True
+                    # Integrate into absolute coords (one axis per event; the other is unchanged)
+                    code = event.code
+                    if code == rel_x:
+                        d = value if unit_scale else int(round(value * sx))
+                        with lock:
+                            x = self._x + d
+                            self._x = min_x if x < min_x else max_x if x > max_x else x
+                            self._moved = True
+                    elif code == rel_y:
+                        d = value if unit_scale else int(round(value * sy))
+                        with lock:
+                            y = self._y + d
+                            self._y = min_y if y < min_y else max_y if y > max_y else y
+                            self._moved = True
 
             except FileNotFoundError:
                 # Device path not ready yet
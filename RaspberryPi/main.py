@@ -281,16 +281,7 @@ async def run() -> None:
                 x, y = mouse.get_absolute_position()
 
                 # 1) Send position to computer
-                ws.send_json(
-                    {
-                        "type": "mouse_pos",
-                        "x": x,
-                        "y": y,
-                        "w": MOUSE_CONFIG.max_x,
-                        "h": MOUSE_CONFIG.max_y,
-                        "ts": now,
-                    }
-                )
+                ws.send_mouse_pos(x, y, MOUSE_CONFIG.max_x, MOUSE_CONFIG.max_y)
                 last_sent = now
 
                 # 2) Local audio feedback based on current cell score (0..100)
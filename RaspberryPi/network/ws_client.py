@@ -3,14 +3,20 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import struct
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import websockets
 
 
 logger = logging.getLogger(__name__)
 
+# Binary mouse_pos frame: type byte 0x01, then x, y, w, h as big-endian float32
+# (17 bytes). Must match Computer/network/ws_server.py.
+MSG_MOUSE_POS = 0x01
+MOUSE_POS_FRAME = struct.Struct("!Bffff")
+
 
 @dataclass(frozen=True)
 class WebSocketClientConfig:
@@ -26,12 +32,14 @@ class WebSocketClient:
 
     - call `start()` to begin background task
     - call `send_json(...)` to enqueue outbound JSON messages
+    - call `send_mouse_pos(...)` for position updates (compact binary frame)
     - later we can add inbound message callbacks for commands from the computer
     """
 
     def __init__(self, cfg: WebSocketClientConfig):
         self.cfg = cfg
-        self._send_q: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=200)
+        # dicts are sent as JSON text, bytes as binary frames
+        self._send_q: "asyncio.Queue[Union[Dict[str, Any], bytes]]" = asyncio.Queue(maxsize=200)
         self._task: Optional[asyncio.Task] = None
         self._stop = asyncio.Event()
 
@@ -52,6 +60,13 @@ class WebSocketClient:
         """
         Non-blocking enqueue. If queue is full, drop oldest to keep system responsive.
         """
+        self._enqueue(obj)
+
+    def send_mouse_pos(self, x: float, y: float, w: float, h: float) -> None:
+        """Enqueue a position update as a 17-byte binary frame (see MOUSE_POS_FRAME)."""
+        self._enqueue(MOUSE_POS_FRAME.pack(MSG_MOUSE_POS, x, y, w, h))
+
+    def _enqueue(self, obj: Union[Dict[str, Any], bytes]) -> None:
         try:
             self._send_q.put_nowait(obj)
         except asyncio.QueueFull:
@@ -101,7 +116,10 @@ class WebSocketClient:
     async def _produce_outgoing(self, ws: websockets.WebSocketClientProtocol) -> None:
         while True:
             msg = await self._send_q.get()
-            await ws.send(json.dumps(msg, separators=(",", ":")))
+            if isinstance(msg, bytes):
+                await ws.send(msg)
+            else:
+                await ws.send(json.dumps(msg, separators=(",", ":")))
 
     async def _consume_incoming(self, ws: websockets.WebSocketClientProtocol) -> None:
         async for _ in ws: